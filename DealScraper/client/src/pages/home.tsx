@@ -13,6 +13,8 @@ import { Grid, List, ArrowDown } from "lucide-react";
 import type { Deal, DealFilters } from "@shared/schema";
 
 const ITEMS_PER_PAGE = 12;
+// Deals are scraped in the background, so poll for the ones it publishes.
+const REFETCH_INTERVAL_MS = 60_000;
 
 export default function Home() {
   const { toast } = useToast();
@@ -60,11 +62,13 @@ export default function Home() {
       return response.json();
     },
     enabled: true,
+    refetchInterval: REFETCH_INTERVAL_MS,
   });
 
   const { data: stats, isLoading: statsLoading } = useQuery({
     queryKey: ["/api/deals/stats"],
     enabled: true,
+    refetchInterval: REFETCH_INTERVAL_MS,
   });
 
   const refreshMutation = useMutation({
@@ -82,8 +86,8 @@ export default function Home() {
       queryClient.invalidateQueries({ queryKey: ["/api/deals"] });
       queryClient.invalidateQueries({ queryKey: ["/api/deals/stats"] });
       toast({
-        title: "Deals Refreshed",
-        description: "Successfully fetched the latest deals from all platforms.",
+        title: "Refresh Started",
+        description: "New deals will appear as each platform finishes scraping.",
       });
     },
     onError: (error) => {
@@ -0,0 +1,2 @@
+DELETE FROM "deals" WHERE "id" IN (SELECT "id" FROM (SELECT "id", row_number() OVER (PARTITION BY "deal_url" ORDER BY "scraped_at" DESC NULLS LAST, "id" DESC) AS "rank" FROM "deals") AS "ranked" WHERE "rank" > 1);--> statement-breakpoint
+CREATE UNIQUE INDEX "deals_deal_url_idx" ON "deals" USING btree ("deal_url");
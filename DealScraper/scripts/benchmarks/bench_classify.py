@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Category classification speed: keyword ``any()`` chains vs the shared classifier.
+
+The chain column is the per-branch ``any(word in title.lower() ...)`` test
+the platform modules used; ``classify`` is one precompiled regex scan per
+title and ``classify_many`` one scan over the whole batch.  ``--extra``
+grows the keyword set with synthetic terms to show how each side scales;
+every method is checked to pick the same categories.  ``speedup`` is chain
+over ``classify``, the per-card path the scrapers use.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dealscraper.categories import CATEGORY_KEYWORDS, Classifier
+from pages import WORDS
+
+
+def chain_classify(keywords, title, default):
+    for category, words in keywords.items():
+        if any(word in title.lower() for word in words):
+            return category
+    return default
+
+
+def grow(keywords, extra, rng):
+    grown = {category: list(words) for category, words in keywords.items()}
+    categories = list(grown)
+    for _ in range(extra):
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+        grown[rng.choice(categories)].append(word)
+    return grown
+
+
+def timed(function, min_time):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        result = function()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / runs, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--titles', type=int, default=1000, help='titles per batch')
+    parser.add_argument('--extra', type=int, nargs='*', default=[0, 1000, 5000],
+                        help='synthetic keywords to add on top of the real ones')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds to run each method for')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    titles = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 9))) for _ in range(args.titles)]
+    default = 'electronics'
+
+    print(f"{'keywords':>8} {'chain us':>9} {'classify us':>12} {'many us':>8} {'speedup':>8}")
+    for extra in args.extra:
+        keywords = grow(CATEGORY_KEYWORDS, extra, rng)
+        classifier = Classifier(keywords)
+        chain_time, expected = timed(lambda: [chain_classify(keywords, t, default) for t in titles], args.min_time)
+        single_time, single = timed(lambda: [classifier.classify(t, default) for t in titles], args.min_time)
+        many_time, many = timed(lambda: classifier.classify_many(titles, default), args.min_time)
+        if single != expected or many != expected:
+            raise SystemExit(f"{extra} extra keywords: classifier disagrees with the keyword chain")
+        size = sum(len(words) for words in keywords.values())
+        per_title = 1e6 / len(titles)
+        print(f"{size:8} {chain_time * per_title:9.2f} {single_time * per_title:12.2f} "
+              f"{many_time * per_title:8.2f} {chain_time / single_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
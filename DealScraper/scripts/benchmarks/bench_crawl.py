@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Crawl mode throughput and memory as the page budget grows, fully offline.
+
+Each platform is crawled in a fresh process against a synthetic site of
+category and pagination pages served from a local stand-in server, once per
+``--max-pages`` budget.  ``pages`` and ``deals`` are what the crawl fetched
+and emitted (deals are counted and dropped, as a streaming consumer would),
+``pages/s`` and ``deals/s`` are end-to-end rates and ``peak MB`` is the
+process's peak RSS, which should stay roughly flat as the budget grows.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_scrapers import peak_rss_mb
+from dealscraper.engine import Engine
+from dealscraper.metrics import Metrics
+from dealscraper.platforms import PLATFORMS
+from pages import crawl_site
+from server import StandInServer
+
+
+def measure(name, origin, max_pages, max_depth, workers):
+    platform = PLATFORMS[name]
+    metrics = Metrics()
+    deals = 0
+
+    def count(deal):
+        nonlocal deals
+        deals += 1
+
+    async def run():
+        async with Engine(origin=origin) as engine:
+            await engine.crawl_platform(platform, count, metrics, max_depth=max_depth,
+                                        max_pages=max_pages, workers=workers)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    return {
+        'pages': len(metrics.pages),
+        'deals': deals,
+        'pagesPerSec': len(metrics.pages) / elapsed,
+        'dealsPerSec': deals / elapsed,
+        'peakRssMb': peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platforms', nargs='*', default=list(PLATFORMS))
+    parser.add_argument('--max-pages', type=int, nargs='*', default=[50, 200, 800],
+                        help='page budgets to crawl with')
+    parser.add_argument('--max-depth', type=int, default=2, help='category links to follow')
+    parser.add_argument('--workers', type=int, default=4, help='crawl workers per platform')
+    parser.add_argument('--categories', type=int, default=40, help='category pages in the synthetic site')
+    parser.add_argument('--pages', type=int, default=25, help='pagination pages per category')
+    parser.add_argument('--cards', type=int, default=60, help='cards per page')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    print(f"{'platform':<10} {'budget':>6} {'pages':>6} {'deals':>7} {'pages/s':>8} {'deals/s':>8} {'peak MB':>8}")
+    for name in args.platforms:
+        site = crawl_site(PLATFORMS[name], args.categories, args.pages, args.cards)
+        with StandInServer(site) as server:
+            for budget in args.max_pages:
+                with ProcessPoolExecutor(1, mp_context=context) as pool:
+                    result = pool.submit(measure, name, server.origin, budget, args.max_depth,
+                                         args.workers).result()
+                print(f"{name:<10} {budget:6} {result['pages']:6} {result['deals']:7} "
+                      f"{result['pagesPerSec']:8.1f} {result['dealsPerSec']:8.0f} {result['peakRssMb']:8.1f}")
+
+
+if __name__ == '__main__':
+    main()
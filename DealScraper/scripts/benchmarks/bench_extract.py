@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Parse-and-extract speed of the compiled XPath specs against BeautifulSoup.
+
+The BeautifulSoup reference evaluates the same per-platform spec with the
+``find``/``find_all`` calls the scrapers used before, so both sides run
+identical ``parse_card`` logic and must yield identical deals.  The
+incremental column feeds the page in network-sized chunks and stops once
+the card limit or deal quota is reached, as ``Engine(incremental=True)``
+does; ``read %`` is the share of the page it needed.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from dealscraper.engine import CHUNK_SIZE
+from dealscraper.incremental import CardStream
+from dealscraper.platforms import Drop, PLATFORMS
+from dealscraper.util import absolute_url
+from pages import build_page
+
+
+class SoupPlatform:
+    """Runs a platform's ``parse_card`` with BeautifulSoup lookups."""
+
+    def __init__(self, platform):
+        self.platform = platform
+        self.queries = {
+            field: [self._query(select) for select in selects]
+            for field, selects in platform.selectors.items()
+        }
+
+    def __getattr__(self, name):
+        return getattr(self.platform, name)
+
+    @staticmethod
+    def _query(select):
+        kwargs = {}
+        if select.class_:
+            kwargs['class_'] = re.compile(select.class_)
+        if select.attr:
+            kwargs[select.attr] = True
+        return select.tags, kwargs, select.limit
+
+    def find(self, field, node):
+        for tags, kwargs, _ in self.queries[field]:
+            found = node.find(tags, **kwargs)
+            if found:
+                return found
+        return None
+
+    def text(self, field, node):
+        element = self.find(field, node)
+        return element.get_text() if element is not None else None
+
+    def deal_url(self, card):
+        link = card.find('a', href=True)
+        if link is None and card.name == 'a' and card.get('href'):
+            link = card
+        if link is None:
+            link = card.find_parent('a', href=True)
+        url = absolute_url(link['href'] if link is not None else None, self.base_url)
+        if url is None:
+            raise Drop('no link')
+        return url
+
+    def extract(self, content):
+        soup = BeautifulSoup(content, 'lxml')
+        (tags, kwargs, limit), = self.queries['cards']
+        deals = []
+        for card in soup.find_all(tags, **kwargs)[:limit]:
+            try:
+                deal = type(self.platform).parse_card(self, card)
+            except Exception:
+                continue
+            if deal:
+                deals.append(deal)
+        return deals
+
+
+def incremental_extract(platform, page):
+    cards = CardStream(platform)
+    deals = []
+    for offset in range(0, len(page), CHUNK_SIZE):
+        deals.extend(cards.feed(page[offset:offset + CHUNK_SIZE]))
+        if cards.exhausted or len(deals) >= platform.max_deals:
+            break
+    else:
+        deals.extend(cards.close())
+    return deals[:platform.max_deals], cards.bytes_fed
+
+
+def timed(extract, pages, min_time):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        for page in pages:
+            deals = extract(page)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / (runs * len(pages)), deals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platforms', nargs='*', default=list(PLATFORMS))
+    parser.add_argument('--cards', type=int, default=60, help='cards per stand-in page')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds to run each side for')
+    args = parser.parse_args()
+
+    print(f"{'platform':<10} {'page KB':>8} {'soup ms':>9} {'xpath ms':>9} {'speedup':>8} "
+          f"{'incr ms':>8} {'read %':>7} {'deals':>6}")
+    for name in args.platforms:
+        platform = PLATFORMS[name]
+        pages = [build_page(name, url, cards=args.cards) for url in platform.urls]
+        soup_time, soup_deals = timed(SoupPlatform(platform).extract, pages, args.min_time)
+        xpath_time, xpath_deals = timed(platform.extract, pages, args.min_time)
+        if soup_deals != xpath_deals:
+            raise SystemExit(f"{name}: XPath extraction differs from the BeautifulSoup reference")
+        incr_time, (incr_deals, _) = timed(lambda page: incremental_extract(platform, page), pages, args.min_time)
+        if incr_deals != xpath_deals[:platform.max_deals]:
+            raise SystemExit(f"{name}: incremental extraction differs from the full parse")
+        read = sum(incremental_extract(platform, page)[1] for page in pages) / sum(len(page) for page in pages)
+        size = sum(len(page) for page in pages) / len(pages) / 1024
+        print(f"{name:<10} {size:8.0f} {soup_time * 1000:9.2f} {xpath_time * 1000:9.2f} "
+              f"{soup_time / xpath_time:7.1f}x {incr_time * 1000:8.2f} {read * 100:6.0f}% {len(xpath_deals):6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Price history query speed as the store grows.
+
+Fills a throwaway :class:`~dealscraper.history.PriceHistory` with
+``--products`` deals observed every ``--every`` minutes over ``--days``
+days, then times the per-deal queries the scrapers make: the full history,
+the lowest price over 30 days and the stats against the 90-day median.
+Each query is a range scan of the ``(fingerprint, ts)`` primary key, so its
+time should follow the rows of one deal rather than the size of the store.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dealscraper.history import DAY, PriceHistory
+from dealscraper.util import make_deal
+
+
+def fill(history, products, days, every, rng):
+    now = time.time()
+    steps = int(days * DAY // (every * 60))
+    deals = [make_deal('amazon', f'Product {i}', 'electronics', 2000, 1000, 50,
+                       f'https://img.example.com/{i}.jpg', f'https://www.amazon.in/dp/{i}')
+             for i in range(products)]
+    for step in range(steps):
+        ts = now - (steps - step) * every * 60
+        for deal in deals:
+            deal.discounted_price = 1000 + rng.randint(-200, 200)
+            history.add(deal, ts)
+        history.flush()
+    return deals
+
+
+def timed(function, keys):
+    start = time.perf_counter()
+    for key in keys:
+        function(key)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--products', type=int, default=5000, help='distinct deals in the store')
+    parser.add_argument('--days', type=float, default=30, help='days of history per deal')
+    parser.add_argument('--every', type=float, default=60, help='minutes between observations of a deal')
+    parser.add_argument('--queries', type=int, default=1000, help='deals queried per measurement')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'history.sqlite3')
+        history = PriceHistory(path)
+        start = time.perf_counter()
+        deals = fill(history, args.products, args.days, args.every, rng)
+        elapsed = time.perf_counter() - start
+        rows = history.db.execute('SELECT COUNT(*) FROM observations').fetchone()[0]
+        history.close()
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"{rows:,} rows in {elapsed:.1f}s, {size / 1e6:.1f} MB ({size / rows:.1f} bytes/row)")
+
+        history = PriceHistory(path)
+        keys = rng.sample(deals, min(args.queries, len(deals)))
+        print(f"{'query':<10} {'ms':>8}")
+        for name, query in (
+            ('history', history.history),
+            ('lowest', lambda deal: history.lowest(deal, 30)),
+            ('stats', history.real_discount),
+        ):
+            print(f"{name:<10} {timed(query, keys) * 1000:8.3f}")
+        history.close()
+
+
+if __name__ == '__main__':
+    main()
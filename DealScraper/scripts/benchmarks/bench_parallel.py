@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""How crawl throughput scales with parse workers, fully offline.
+
+A platform's synthetic site (see ``bench_crawl.py``) is crawled in a fresh
+process once per ``--workers`` count: ``0`` parses on the event loop, any
+other count hands pages to that many parse workers.  ``speedup`` is
+relative to the first count listed.  Parsing is the bottleneck of a crawl
+served locally, so on an idle machine the speedup should track the worker
+count up to the number of cores (``cores`` below).
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dealscraper.engine import Engine
+from dealscraper.parallel import gil_enabled
+from dealscraper.platforms import PLATFORMS
+from pages import crawl_site
+from server import StandInServer
+
+
+def measure(name, origin, parse_workers, max_pages):
+    platform = PLATFORMS[name]
+    deals = 0
+
+    def count(deal):
+        nonlocal deals
+        deals += 1
+
+    async def run():
+        async with Engine(origin=origin, parse_workers=parse_workers, per_host=8) as engine:
+            # Keep enough pages in flight to feed every parse worker.
+            await engine.crawl_platform(platform, count, max_pages=max_pages,
+                                        workers=max(4, parse_workers * 2))
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return deals, time.perf_counter() - start
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platform', nargs='?', default='amazon', choices=list(PLATFORMS))
+    parser.add_argument('--workers', type=int, nargs='*',
+                        default=sorted({0, 1, cores} | {n for n in (2, 4) if n < cores}),
+                        help='parse worker counts to compare')
+    parser.add_argument('--max-pages', type=int, default=400, help='pages to crawl per run')
+    parser.add_argument('--cards', type=int, default=60, help='cards per page')
+    args = parser.parse_args()
+
+    platform = PLATFORMS[args.platform]
+    site = crawl_site(platform, categories=args.max_pages // 10 + 1, pages=10, cards=args.cards)
+    context = multiprocessing.get_context('spawn')
+    print(f"cores {cores}, {'GIL' if gil_enabled() else 'free-threaded'}, {args.max_pages} pages of {platform.name}")
+    print(f"{'workers':>7} {'pages/s':>8} {'deals':>7} {'speedup':>8}")
+    baseline = None
+    with StandInServer(site) as server:
+        for workers in args.workers:
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                deals, elapsed = pool.submit(measure, platform.name, server.origin, workers,
+                                             args.max_pages).result()
+            rate = args.max_pages / elapsed
+            baseline = baseline or rate
+            print(f"{workers:7} {rate:8.1f} {deals:7} {rate / baseline:7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Memory and serialization cost of deal records.
+
+``bytes/deal`` is the memory held per deal as the old nine-key dict and as
+the slotted :class:`~dealscraper.deal.Deal`.  The output table writes the
+same deals in batches of ``--batch-size``: ``batch`` is the JSON object per
+deal record the server used to read, written from ready-made dicts,
+``columns`` the dictionary-encoded columnar record and ``arrow`` an Arrow
+IPC stream (skipped without pyarrow).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dealscraper.columnar import ArrowWriter, columns
+from dealscraper.util import make_deal
+from pages import WORDS
+
+PLATFORMS = ['amazon', 'flipkart', 'myntra', 'meesho']
+CATEGORIES = ['fashion', 'home', 'beauty', 'sports', 'books', 'electronics']
+
+
+def build(count, rng):
+    deals = []
+    for i in range(count):
+        # Platform and category arrive as fresh strings, as they do when
+        # they are copied out of parsed markup or JSON.
+        platform = ''.join(rng.choice(PLATFORMS))
+        category = ''.join(rng.choice(CATEGORIES))
+        title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 9)))
+        price = rng.randint(99, 99999)
+        deals.append(make_deal(platform, title, category, price * 2, price, 50,
+                               f'https://img.example.com/{i}.jpg', f'https://www.example.com/p/{i}'))
+    return deals
+
+
+def held_bytes(factory):
+    tracemalloc.start()
+    records = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(records)
+
+
+def batch_lines(records, size):
+    for start in range(0, len(records), size):
+        yield json.dumps({'type': 'batch', 'deals': records[start:start + size]})
+
+
+def column_lines(deals, size):
+    for start in range(0, len(deals), size):
+        yield json.dumps(columns(deals[start:start + size]))
+
+
+def arrow_size(deals, size):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'deals.arrow')
+        writer = ArrowWriter(path, size)
+        for deal in deals:
+            writer.deal(deal)
+        writer.close()
+        return os.path.getsize(path)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--deals', type=int, default=100_000, help='deals to build and write')
+    parser.add_argument('--batch-size', type=int, default=1000, help='deals per written batch')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    deals = build(args.deals, rng)
+    print(f"bytes/deal: dict {held_bytes(lambda: [d.as_dict() for d in build(10_000, random.Random(1))]):.0f}, "
+          f"Deal {held_bytes(lambda: build(10_000, random.Random(1))):.0f}")
+
+    records = [deal.as_dict() for deal in deals]
+    print(f"{'format':<8} {'ms':>8} {'MB':>8}")
+    for name, write in (
+        ('batch', lambda: sum(len(line) + 1 for line in batch_lines(records, args.batch_size))),
+        ('columns', lambda: sum(len(line) + 1 for line in column_lines(deals, args.batch_size))),
+    ):
+        elapsed, size = timed(write)
+        print(f"{name:<8} {elapsed * 1000:8.1f} {size / 1e6:8.2f}")
+    try:
+        elapsed, size = timed(lambda: arrow_size(deals, args.batch_size))
+    except RuntimeError as e:
+        print(f"{'arrow':<8} skipped: {e}")
+    else:
+        print(f"{'arrow':<8} {elapsed * 1000:8.1f} {size / 1e6:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Repeatable throughput numbers for each platform's scraper, fully offline.
+
+Every platform is measured in a fresh process against the fixture corpus
+served from a local stand-in server: ``pages/s`` is end-to-end engine
+throughput (fetch, parse and extract), ``us/card`` is offline extraction
+time per card, ``peak MB`` is the process's peak RSS and ``deals`` is what
+one scrape yields.  ``--save`` writes the results as JSON and ``--compare``
+checks a run against a saved one, exiting non-zero when throughput or
+per-card time regress by more than ``--threshold``.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import CORPUS_DIR, load_page, load_pages
+from dealscraper.engine import Engine
+from dealscraper.platforms import PLATFORMS
+from dealscraper.selectors import parse_html
+from server import StandInServer
+
+
+def peak_rss_mb():
+    # ru_maxrss survives exec on Linux, so a spawned worker would report its
+    # parent's peak if that was higher; VmHWM is the process's own.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def time_extraction(platform, pages, min_time):
+    cards = 0
+    for page in pages:
+        root = parse_html(page)
+        cards += len(platform.find_cards(root)) if root is not None else 0
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for page in pages:
+            platform.extract(page)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / rounds, cards
+
+
+async def time_engine(platform, origin, min_time, incremental):
+    async with Engine(origin=origin, incremental=incremental) as engine:
+        deals = await engine.scrape_platform(platform)
+        rounds = 0
+        start = time.perf_counter()
+        while True:
+            await engine.scrape_platform(platform)
+            rounds += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                return rounds * len(platform.urls) / elapsed, len(deals)
+
+
+def measure(name, origin, corpus, min_time, incremental):
+    platform = PLATFORMS[name]
+    pages = [load_page(platform, url, corpus)[0] for url in platform.urls]
+    per_round, cards = time_extraction(platform, pages, min_time)
+    pages_per_sec, deals = asyncio.run(time_engine(platform, origin, min_time, incremental))
+    return {
+        'pagesPerSec': pages_per_sec,
+        'usPerCard': per_round / cards * 1e6 if cards else None,
+        'cards': cards,
+        'deals': deals,
+        'peakRssMb': peak_rss_mb(),
+    }
+
+
+def change(current, previous, lower_is_better=False):
+    if not current or not previous:
+        return None
+    delta = (current - previous) / previous
+    return -delta if lower_is_better else delta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platforms', nargs='*', default=list(PLATFORMS))
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='fixture corpus directory')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds to run each measurement for')
+    parser.add_argument('--incremental', action='store_true', help='run the engine in incremental mode')
+    parser.add_argument('--save', metavar='PATH', help='write the results as JSON')
+    parser.add_argument('--compare', metavar='PATH', help='compare against results saved with --save')
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help='relative slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    platforms = [PLATFORMS[name] for name in args.platforms]
+    pages, sources = load_pages(platforms, args.corpus)
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    results = {}
+    regressions = []
+    context = multiprocessing.get_context('spawn')
+    print(f"{'platform':<10} {'pages':>9} {'pages/s':>9} {'us/card':>8} {'peak MB':>8} {'deals':>6}  vs saved")
+    with StandInServer(pages) as server:
+        for platform in platforms:
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                result = pool.submit(measure, platform.name, server.origin, args.corpus,
+                                     args.min_time, args.incremental).result()
+            result['source'] = sources[platform.name]
+            results[platform.name] = result
+
+            notes = []
+            saved = previous.get(platform.name, {})
+            for label, key, lower_is_better in (('pages/s', 'pagesPerSec', False), ('us/card', 'usPerCard', True)):
+                delta = change(result[key], saved.get(key), lower_is_better)
+                if delta is None:
+                    continue
+                notes.append(f"{label} {delta * 100:+.0f}%")
+                if delta < -args.threshold:
+                    regressions.append(f"{platform.name} {label}")
+            per_card = f"{result['usPerCard']:8.1f}" if result['usPerCard'] is not None else f"{'-':>8}"
+            print(f"{platform.name:<10} {result['source']:>9} {result['pagesPerSec']:9.1f} {per_card} "
+                  f"{result['peakRssMb']:8.1f} {result['deals']:6}  {', '.join(notes)}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        raise SystemExit(f"regressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare a cold ``python3 scrape.py`` spawn per refresh with a warm ``--serve`` worker.
+
+Both modes fetch from a local stand-in server so the numbers measure process
+startup, imports and connection setup rather than the live sites.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from server import StandInServer
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRAPE = os.path.join(SCRIPTS_DIR, 'scrape.py')
+
+
+def time_cold(platforms, origin, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRAPE, *platforms, '--origin', origin],
+                       check=True, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def time_warm(platforms, origin, runs):
+    worker = subprocess.Popen([sys.executable, SCRAPE, '--serve', '--origin', origin],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    samples = []
+    try:
+        for request_id in range(runs + 1):
+            start = time.perf_counter()
+            worker.stdin.write(json.dumps({'id': request_id, 'platforms': platforms}) + '\n')
+            worker.stdin.flush()
+            response = json.loads(worker.stdout.readline())
+            if response.get('id') != request_id:
+                raise RuntimeError(f"unexpected response: {response}")
+            samples.append(time.perf_counter() - start)
+    finally:
+        worker.stdin.close()
+        worker.wait(timeout=10)
+    # The first request pays for interpreter startup; report it separately.
+    return samples[0], samples[1:]
+
+
+def summarize(label, samples):
+    ordered = sorted(samples)
+    p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+    print(f"{label:<22} median {statistics.median(samples) * 1000:8.1f} ms   "
+          f"p90 {p90 * 1000:8.1f} ms   mean {statistics.mean(samples) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platforms', nargs='*', default=['amazon', 'flipkart', 'myntra', 'meesho'])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with StandInServer() as server:
+        cold = time_cold(args.platforms, server.origin, args.runs)
+        first, warm = time_warm(args.platforms, server.origin, args.runs)
+
+    print(f"{args.runs} refreshes of {', '.join(args.platforms)}")
+    summarize('cold spawn', cold)
+    summarize('warm worker', warm)
+    print(f"{'warm worker startup':<22} {first * 1000:8.1f} ms")
+    print(f"speedup (median)       {statistics.median(cold) / statistics.median(warm):8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Recorded platform pages used as offline fixtures.
+
+Pages live under ``benchmarks/corpus/<host>/<path>.html``, one file per seed
+URL, and are written by ``record.py``.  Seed URLs without a recording fall
+back to the deterministic stand-in page from :mod:`pages`.
+"""
+import os
+import re
+from urllib.parse import urlsplit
+
+from pages import build_page
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+
+def corpus_path(url, corpus=CORPUS_DIR):
+    parts = urlsplit(url)
+    name = parts.path.strip('/').replace('/', '_') or 'index'
+    if parts.query:
+        name += '_' + parts.query
+    return os.path.join(corpus, parts.hostname, re.sub(r'[^\w.-]', '_', name) + '.html')
+
+
+def server_path(url):
+    parts = urlsplit(url)
+    return f'/{parts.hostname}{parts.path}'
+
+
+def load_page(platform, url, corpus=CORPUS_DIR):
+    """Return ``(page bytes, source)`` where source is ``recorded`` or ``synthetic``."""
+    path = corpus_path(url, corpus)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read(), 'recorded'
+    return build_page(platform.name, url), 'synthetic'
+
+
+def load_pages(platforms, corpus=CORPUS_DIR):
+    """Map stand-in server paths to corpus pages and each platform to its page source."""
+    pages = {}
+    sources = {}
+    for platform in platforms:
+        kinds = set()
+        for url in platform.urls:
+            pages[server_path(url)], kind = load_page(platform, url, corpus)
+            kinds.add(kind)
+        sources[platform.name] = kinds.pop() if len(kinds) == 1 else 'mixed'
+    return pages, sources
@@ -0,0 +1,152 @@
+"""Deterministic stand-in pages shaped like each platform's deal listings.
+
+Cards use the same class names the extraction specs look for and are
+surrounded by enough navigation markup to make the page size realistic.
+"""
+import random
+import string
+from urllib.parse import urlsplit
+
+WORDS = [
+    'Wireless', 'Headphones', 'Cotton', 'Shirt', 'Kitchen', 'Mixer', 'Yoga', 'Mat',
+    'Book', 'Set', 'Skincare', 'Kit', 'Phone', 'Case', 'Decor', 'Lamp', 'Running',
+    'Shoe', 'Saree', 'Gadget', 'Smart', 'Watch', 'Kurta', 'Fitness', 'Band',
+]
+
+
+def _title(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 7)))
+
+
+def _chrome(rng, blocks):
+    return ''.join(
+        f'<div class="nav-item n{i}"><span class="label">Menu {i}</span>'
+        f'<a href="/c/{i}">{_title(rng)}</a><p>{_title(rng)} {_title(rng)}</p></div>'
+        for i in range(blocks)
+    )
+
+
+def amazon(rng, cards):
+    items = []
+    for i in range(cards):
+        discount = '' if i % 5 == 0 else f'<span class="savingsPercentage">{rng.randint(5, 80)}% off</span>'
+        price = '' if i % 9 == 0 else f'<span class="a-price">₹{rng.randint(99, 99999):,}</span>'
+        items.append(
+            f'<div class="DealCard-{i} DealCard"><a href="/dp/B{i:05d}?ref=deal">'
+            f'<img src="https://m.media-amazon.com/images/I/{i}.jpg"></a>'
+            f'<div class="DealTitle">{_title(rng)}</div>{price}{discount}</div>'
+        )
+    return items
+
+
+def flipkart(rng, cards):
+    items = []
+    for i in range(cards):
+        old_price = '' if i % 4 == 0 else f'<div class="_3I9_wc _3Djpdu">₹{rng.randint(1000, 99999):,}</div>'
+        discount = '' if i % 3 == 0 else f'<div class="_3Ay6sb"><span>{rng.randint(5, 80)}% off</span></div>'
+        items.append(
+            f'<div class="_1AtVbE col-12-12"><a href="/p/item{i}?pid=ITM{i}">'
+            f'<img src="https://rukminim1.flixcart.com/image/{i}.jpg">'
+            f'<div class="_4rR01T">{_title(rng)}</div></a>'
+            f'<div class="_30jeq3">₹{rng.randint(99, 9999):,}</div>{old_price}{discount}</div>'
+        )
+    return items
+
+
+def myntra(rng, cards):
+    items = []
+    for i in range(cards):
+        strike = '' if i % 4 == 0 else f'<span class="product-strike">Rs. {rng.randint(1000, 9999)}</span>'
+        discount = '' if i % 3 == 0 else f'<span class="product-discountPercentage">({rng.randint(10, 80)}% OFF)</span>'
+        items.append(
+            f'<li class="product-base"><a href="/shirts/brand/{i}/buy">'
+            f'<img src="https://assets.myntassets.com/images/{i}.jpg">'
+            f'<h3 class="product-brand">Brand{i}</h3><h4 class="product-product">{_title(rng)}</h4>'
+            f'<div class="product-price"><span class="product-discountedPrice">Rs. {rng.randint(199, 999)}</span>'
+            f'{strike}{discount}</div></a></li>'
+        )
+    return items
+
+
+def meesho(rng, cards):
+    items = []
+    for i in range(cards):
+        attr = 'src' if i % 2 else 'data-src'
+        items.append(
+            f'<a href="/product-{i}/p/{i}"><div class="sc-dkrFOg ProductCard__Wrapper">'
+            f'<img {attr}="https://images.meesho.com/images/{i}.jpg">'
+            f'<p class="Text__StyledText ProductCard__ProductTitle">{_title(rng)}</p>'
+            f'<h5 class="Text__StyledText">₹{rng.randint(99, 999)}</h5></div></a>'
+        )
+    return items
+
+
+BUILDERS = {'amazon': amazon, 'flipkart': flipkart, 'myntra': myntra, 'meesho': meesho}
+
+
+# Category URL and pagination suffix of each platform's listing pages, in the
+# shape its ``crawl_links`` patterns follow.
+CRAWL_LINKS = {
+    'amazon': ('/s?k={slug}', '&page={page}'),
+    'flipkart': ('/{slug}/pr?sid={slug}', '&page={page}'),
+    'myntra': ('/{slug}', '?p={page}'),
+    'meesho': ('/{slug}/pl/{slug}', '?page={page}'),
+}
+
+
+def build_page(platform, url, cards=60, chrome=1500, links=()):
+    """Return the stand-in page for ``url`` as UTF-8 bytes, with ``links`` in its navigation."""
+    rng = random.Random(f'{platform}:{url}')
+    head = _chrome(rng, chrome // 2)
+    body = ''.join(BUILDERS[platform](rng, cards))
+    tail = _chrome(rng, chrome - chrome // 2)
+    nav = ''.join(f'<a class="crawl" href="{link}">{i}</a>' for i, link in enumerate(links))
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Deals</title></head>'
+        f'<body><header>{head}<nav>{nav}</nav></header><main>{body}</main>'
+        f'<footer>{tail}</footer></body></html>'
+    ).encode('utf-8')
+
+
+def _slug(number):
+    letters = ''
+    while True:
+        number, digit = divmod(number, 26)
+        letters += string.ascii_lowercase[digit]
+        if not number:
+            return 'deals-' + letters
+
+
+def crawl_site(platform, categories=20, pages=10, cards=60, chrome=200):
+    """Map stand-in server paths to a crawlable site for ``platform``.
+
+    Every seed page links to ``categories`` listing pages, and each of those
+    links to its ``pages`` pagination pages and to the next category, so a
+    crawl finds ``categories * pages`` listing pages.  Keys include the query
+    string, which the stand-in server matches before the bare path.
+    """
+    host = urlsplit(platform.base_url).hostname
+    category, suffix = CRAWL_LINKS[platform.name]
+    listings = [
+        [category.format(slug=_slug(c)) + (suffix.format(page=n) if n > 1 else '') for n in range(1, pages + 1)]
+        for c in range(categories)
+    ]
+    site = {}
+    for url in platform.urls:
+        seed = urlsplit(url)
+        site[f'/{host}{seed.path}'] = build_page(platform.name, url, cards, chrome, [urls[0] for urls in listings])
+    for c, urls in enumerate(listings):
+        following = listings[(c + 1) % categories][0]
+        for path in urls:
+            site[f'/{host}{path}'] = build_page(platform.name, path, cards, chrome, urls + [following])
+    return site
+
+
+def site_pages(platforms, **options):
+    """Map stand-in server paths to pages for every seed URL of ``platforms``."""
+    pages = {}
+    for platform in platforms:
+        for url in platform.urls:
+            parts = urlsplit(url)
+            pages[f'/{parts.hostname}{parts.path}'] = build_page(platform.name, url, **options)
+    return pages
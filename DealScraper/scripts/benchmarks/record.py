@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Record each platform's seed pages into the offline fixture corpus.
+
+Pages are fetched from the live sites with the same headers and timeouts
+the scrapers use and saved untouched.  The card count printed for each page
+shows whether it is a real listing or an anti-bot interstitial.  With
+``--synthetic`` the deterministic stand-in pages are written instead.
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+
+from corpus import CORPUS_DIR, corpus_path
+from dealscraper.platforms import PLATFORMS
+from dealscraper.selectors import parse_html
+from pages import build_page
+
+
+async def fetch(session, platform, url):
+    timeout = aiohttp.ClientTimeout(total=platform.timeout)
+    async with session.get(url, headers=platform.headers, timeout=timeout) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+async def record(platforms, corpus, synthetic):
+    async with aiohttp.ClientSession() as session:
+        for platform in platforms:
+            for url in platform.urls:
+                try:
+                    if synthetic:
+                        page = build_page(platform.name, url)
+                    else:
+                        page = await fetch(session, platform, url)
+                except Exception as e:
+                    print(f"{url}: {str(e) or type(e).__name__}", file=sys.stderr)
+                    continue
+                path = corpus_path(url, corpus)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(page)
+                root = parse_html(page)
+                cards = len(platform.find_cards(root)) if root is not None else 0
+                print(f"{url} -> {os.path.relpath(path, corpus)} ({len(page) // 1024} KB, {cards} cards)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('platforms', nargs='*', default=list(PLATFORMS))
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='directory to write pages into')
+    parser.add_argument('--synthetic', action='store_true', help='write stand-in pages instead of fetching')
+    args = parser.parse_args()
+    asyncio.run(record([PLATFORMS[name] for name in args.platforms], args.corpus, args.synthetic))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import hashlib
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (incremental parsing) reset the
+        # connection mid-response; that is expected, not a server error.
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class StandInServer:
+    """Local HTTP server that stands in for the live platform sites.
+
+    ``pages`` maps a request path (``/www.amazon.in/deals``) to the bytes to
+    serve, trying the path with its query string first; paths without an
+    entry get ``default``.  Every response carries an ETag and conditional
+    requests that match it get a 304.  Paths in ``statuses`` are answered
+    with that error status and an empty body instead.  ``requests`` and
+    ``bytes_sent`` count what was served.  Point an engine at it with
+    ``Engine(origin=server.origin)``.
+    """
+
+    def __init__(self, pages=None, default=b'<html><body></body></html>', statuses=None):
+        self.pages = pages or {}
+        self.statuses = statuses or {}
+        self.default = default
+        self.requests = 0
+        self.bytes_sent = 0
+        self.httpd = None
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def origin(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status = server.statuses.get(self.path)
+                if status is not None:
+                    server.requests += 1
+                    self.send_response(status)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = server.pages.get(self.path)
+                if body is None:
+                    body = server.pages.get(self.path.split('?', 1)[0], server.default)
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                server.requests += 1
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+                server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = _HTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
@@ -0,0 +1,4 @@
+from .engine import Engine, crawl, scrape, stream
+from .platforms import PLATFORMS, Platform, get_platform
+
+__all__ = ['Engine', 'PLATFORMS', 'Platform', 'crawl', 'get_platform', 'scrape', 'stream']
@@ -0,0 +1,110 @@
+import re
+
+# In priority order: a title matching keywords of several categories gets the
+# first one listed.  Keywords match anywhere in the lower-cased title.
+CATEGORY_KEYWORDS = {
+    'fashion': ['cloth', 'shirt', 'dress', 'shoe', 'jean', 'fashion', 'saree', 'kurta'],
+    'home': ['home', 'kitchen', 'furniture', 'decor'],
+    'beauty': ['beauty', 'cosmetic', 'skincare'],
+    'sports': ['sport', 'fitness', 'gym', 'yoga'],
+    'books': ['book'],
+    'electronics': ['phone', 'electronic', 'gadget'],
+}
+
+
+def trie_pattern(words):
+    """Compile ``words`` into one regex alternation factored as a prefix trie.
+
+    Python's ``re`` tries alternatives one after another, so sharing prefixes
+    keeps matching cost close to the length of the longest keyword instead of
+    the number of keywords.  Optional tails are greedy, so the longest keyword
+    starting at a position is the one matched.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+class Classifier:
+    """Assigns a category to titles with one precompiled regex scan.
+
+    The pattern is wrapped in a lookahead so overlapping keywords are all
+    found, and every match is ranked by the highest-priority keyword that is
+    a prefix of it, which is exactly the set of keywords matching at that
+    position.
+    """
+
+    def __init__(self, keywords=CATEGORY_KEYWORDS):
+        self.categories = list(keywords)
+        priority = {}
+        for rank, words in enumerate(keywords.values()):
+            for word in words:
+                priority.setdefault(word.lower(), rank)
+        self.rank = {
+            word: min(priority[word[:end]] for end in range(1, len(word) + 1) if word[:end] in priority)
+            for word in priority
+        }
+        alternation = trie_pattern(priority)
+        self.pattern = re.compile(f'(?=({alternation}))')
+        # NUL, which never occurs in parsed text, separates the titles of a batch.
+        self.batch_pattern = re.compile(f'(?=({alternation}|\0))')
+
+    def _best(self, matches):
+        best = None
+        for match in matches:
+            rank = self.rank[match.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        return best
+
+    def classify(self, title, default):
+        best = self._best(self.pattern.finditer(title.lower()))
+        return default if best is None else self.categories[best]
+
+    def classify_many(self, titles, default):
+        """Classify a batch of titles with a single scan over their concatenation.
+
+        The platforms classify each card with :meth:`classify` as it is
+        parsed, since cards are memoized and streamed one at a time; this
+        is for callers that already hold a whole batch of titles.
+        """
+        titles = list(titles)
+        if not titles:
+            return []
+        best = []
+        rank = None
+        for word in self.batch_pattern.findall('\0'.join(titles).lower() + '\0'):
+            if word == '\0':
+                best.append(rank)
+                rank = None
+            elif rank is None or self.rank[word] < rank:
+                rank = self.rank[word]
+        return [default if rank is None else self.categories[rank] for rank in best]
+
+
+CLASSIFIER = Classifier()
+
+
+def classify(title, default):
+    return CLASSIFIER.classify(title, default)
+
+
+def classify_many(titles, default):
+    return CLASSIFIER.classify_many(titles, default)
@@ -0,0 +1,274 @@
+import argparse
+import asyncio
+import cProfile
+import json
+import pstats
+import sys
+
+from .columnar import COLUMNAR_BATCH_SIZE, ArrowWriter
+from .crawl import DEFAULT_MAX_DEPTH, DEFAULT_MAX_PAGES, DEFAULT_WORKERS
+from .deal import dumps
+from .delta import DEFAULT_MAX_AGE, DeltaFilter, DeltaIndex
+from .engine import POOL_SIZE, PER_HOST, crawl, scrape, stream
+from .history import DEFAULT_DAYS, PriceHistory
+from .httpcache import DEFAULT_MAX_BYTES, DEFAULT_TTL, HttpCache
+from .memo import DEFAULT_MAX_ENTRIES, MemoStore
+from .metrics import Metrics
+from .output import NdjsonWriter
+from .platforms import PLATFORMS
+from .scheduler import DEFAULT_JITTER, schedule
+from .throttle import DEFAULT_BURST, DEFAULT_COOLDOWN, DEFAULT_RATE, DEFAULT_RETRIES, DEFAULT_THRESHOLD, Throttle
+from .worker import serve
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Scrape deals from one or more platforms.')
+    parser.add_argument('platforms', nargs='*', metavar='platform',
+                        help=f"platforms to scrape (default: all of {', '.join(PLATFORMS)})")
+    parser.add_argument('--pool-size', type=int, default=POOL_SIZE,
+                        help='maximum open connections across all hosts')
+    parser.add_argument('--per-host', type=int, default=PER_HOST,
+                        help='maximum concurrent requests to a single host')
+    parser.add_argument('--origin',
+                        help='fetch every page from this mirror origin instead of the live site')
+    parser.add_argument('--throttle', action='store_true',
+                        help='rate-limit each host, retry throttled or failed requests with backoff '
+                             'and stop requesting hosts that keep failing')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='with --throttle, requests per second allowed to each host')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST,
+                        help='with --throttle, requests a host may receive at once before --rate applies')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help='with --throttle, times a throttled, failed or timed-out request is retried')
+    parser.add_argument('--breaker-threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help='with --throttle, consecutive failures after which a host is cut off')
+    parser.add_argument('--breaker-cooldown', type=float, default=DEFAULT_COOLDOWN,
+                        help='with --throttle, seconds a cut-off host is left alone before it is tried again')
+    parser.add_argument('--incremental', action='store_true',
+                        help='parse pages while they download and stop reading once enough cards are found')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='parse and extract downloaded pages in this many worker processes')
+    parser.add_argument('--cache', action='store_true',
+                        help='replay or revalidate recently scraped pages from the on-disk HTTP cache')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL,
+                        help='seconds a cached page is replayed before it is revalidated')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='cache size limit in MB; least recently used pages are evicted')
+    parser.add_argument('--memo', action='store_true',
+                        help='reuse deals extracted from page and card markup seen in earlier runs')
+    parser.add_argument('--memo-size', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help='maximum memoized pages and cards; least recently used are evicted')
+    parser.add_argument('--delta', action='store_true',
+                        help='only output deals that are new or changed since the last run')
+    parser.add_argument('--delta-max-age', type=float, default=DEFAULT_MAX_AGE,
+                        help='seconds after which an unchanged deal is output again')
+    parser.add_argument('--history', action='store_true',
+                        help='record the price of every scraped deal in the local price history')
+    parser.add_argument('--price-history', metavar='URL',
+                        help='print the recorded prices of the deal at URL and how its discount compares, '
+                             'then exit')
+    parser.add_argument('--history-days', type=float, default=DEFAULT_DAYS,
+                        help='with --price-history, how many days of history to look at')
+    parser.add_argument('--crawl', action='store_true',
+                        help='follow pagination and category links from the seed pages and keep every card')
+    parser.add_argument('--max-depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help='with --crawl, how many category links deep to follow')
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                        help='with --crawl, maximum pages fetched per platform')
+    parser.add_argument('--crawl-workers', type=int, default=DEFAULT_WORKERS,
+                        help='with --crawl, pages worked on at once per platform')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='stream one JSON record per line as each deal is parsed')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='with --ndjson, group deals into batch records of up to this many')
+    parser.add_argument('--columnar', action='store_true',
+                        help='with --ndjson, write deals as dictionary-encoded columns records '
+                             f'of --batch-size deals (default {COLUMNAR_BATCH_SIZE})')
+    parser.add_argument('--arrow', metavar='PATH',
+                        help='write deals to PATH as an Arrow IPC stream instead of JSON (needs pyarrow)')
+    parser.add_argument('--serve', action='store_true',
+                        help='run as a long-lived worker answering JSON requests on stdin')
+    parser.add_argument('--schedule', action='store_true',
+                        help='keep running, re-scraping each platform on its own interval')
+    parser.add_argument('--interval', action='append', default=[], metavar='PLATFORM=SECONDS',
+                        help='with --schedule, override how often a platform is scraped')
+    parser.add_argument('--jitter', type=float, default=DEFAULT_JITTER,
+                        help='with --schedule, randomly spread each interval by up to this fraction')
+    parser.add_argument('--metrics', action='store_true',
+                        help='add per-page timings and card counts to the --ndjson end record')
+    parser.add_argument('--metrics-file', metavar='PATH',
+                        help='write per-page timings and card counts to PATH as JSON')
+    parser.add_argument('--profile', metavar='PATH',
+                        help='profile the run with cProfile, save the stats to PATH and print a summary')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.platforms if name not in PLATFORMS]
+    if unknown:
+        parser.error(f"unknown platform: {', '.join(unknown)}")
+    intervals = {}
+    for option in args.interval:
+        name, _, seconds = option.partition('=')
+        if name not in PLATFORMS:
+            parser.error(f"unknown platform in --interval: {name}")
+        try:
+            intervals[name] = float(seconds)
+        except ValueError:
+            parser.error(f"invalid --interval: {option}")
+    args.interval = intervals
+
+    engine_options = {
+        'pool_size': args.pool_size,
+        'per_host': args.per_host,
+        'origin': args.origin,
+        'incremental': args.incremental,
+        'parse_workers': args.parse_workers,
+    }
+    if args.cache:
+        engine_options['cache'] = HttpCache(ttl=args.cache_ttl, max_bytes=args.cache_size * 1024 * 1024)
+    if args.throttle:
+        engine_options['throttle'] = Throttle(rate=args.rate, burst=args.burst, retries=args.retries,
+                                              threshold=args.breaker_threshold, cooldown=args.breaker_cooldown)
+    engine_options['memo'] = MemoStore(max_entries=args.memo_size) if args.memo else None
+    if args.columnar and args.batch_size <= 1:
+        args.batch_size = COLUMNAR_BATCH_SIZE
+    if args.crawl:
+        args.budget = {'max_depth': args.max_depth, 'max_pages': args.max_pages, 'workers': args.crawl_workers}
+
+    if not args.profile:
+        return run(args, engine_options)
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(run, args, engine_options)
+    finally:
+        profile.dump_stats(args.profile)
+        pstats.Stats(profile, stream=sys.stderr).sort_stats('cumulative').print_stats(25)
+
+
+def run(args, engine_options):
+    if args.price_history:
+        return run_price_history(args)
+    memo = engine_options['memo']
+    metrics = Metrics() if args.metrics or args.metrics_file else None
+    delta = DeltaIndex(max_age=args.delta_max_age) if args.delta else None
+    history = PriceHistory() if args.history else None
+    try:
+        if args.serve:
+            asyncio.run(serve(engine_options, delta, history))
+            return 0
+        if args.schedule:
+            asyncio.run(schedule(engine_options, names=args.platforms, intervals=args.interval,
+                                 jitter=args.jitter, delta=delta, batch_size=args.batch_size,
+                                 columnar=args.columnar, history=history))
+            return 0
+        if args.arrow:
+            status = run_arrow(args, engine_options, memo, metrics, delta, history)
+        elif args.ndjson:
+            run_ndjson(args, engine_options, memo, metrics, delta, history)
+        else:
+            run_json(args, engine_options, memo, metrics, delta, history)
+        write_metrics(args.metrics_file, metrics)
+        return status if args.arrow else 0
+    finally:
+        if delta is not None:
+            delta.close()
+        if history is not None:
+            history.close()
+
+
+def emit_all(args, engine_options, emit, metrics, history=None):
+    if history:
+        emit = history.recorder(emit)
+    if args.crawl:
+        return crawl(args.platforms, emit, metrics, args.budget, **engine_options)
+    return stream(args.platforms, emit, metrics, **engine_options)
+
+
+def run_ndjson(args, engine_options, memo, metrics, delta, history):
+    writer = NdjsonWriter(batch_size=args.batch_size, columnar=args.columnar)
+    emit = DeltaFilter(delta, writer.deal) if delta else writer.deal
+    count = 0
+    try:
+        count = emit_all(args, engine_options, emit, metrics, history)
+    except Exception as e:
+        sys.stderr.write(f"Fatal error: {str(e)}\n")
+    trailer = {}
+    if memo:
+        trailer['memo'] = memo.stats.as_dict()
+    if args.metrics:
+        trailer['metrics'] = metrics.as_dict()
+    if delta:
+        count = emit.emitted
+        trailer['delta'] = emit.stats()
+    writer.end(count, **trailer)
+
+
+def run_json(args, engine_options, memo, metrics, delta, history):
+    deals = []
+    emit = DeltaFilter(delta, deals.append) if delta else deals.append
+    record = history.recorder(emit) if history else emit
+    try:
+        if args.crawl:
+            crawl(args.platforms, record, metrics, args.budget, **engine_options)
+        else:
+            results = scrape(args.platforms, metrics, **engine_options)
+            for platform_deals in results.values():
+                for deal in platform_deals:
+                    record(deal)
+        print(dumps(deals))
+    except Exception as e:
+        sys.stderr.write(f"Fatal error: {str(e)}\n")
+        print(json.dumps([]))
+    write_stats(memo, emit if delta else None)
+
+
+def run_arrow(args, engine_options, memo, metrics, delta, history):
+    try:
+        writer = ArrowWriter(args.arrow)
+    except RuntimeError as e:
+        sys.stderr.write(f"Fatal error: {str(e)}\n")
+        return 1
+    emit = DeltaFilter(delta, writer.deal) if delta else writer.deal
+    try:
+        emit_all(args, engine_options, emit, metrics, history)
+    except Exception as e:
+        sys.stderr.write(f"Fatal error: {str(e)}\n")
+    finally:
+        writer.close()
+    sys.stderr.write(f"Wrote {writer.count} deals to {args.arrow}\n")
+    write_stats(memo, emit if delta else None)
+    return 0
+
+
+def run_price_history(args):
+    history = PriceHistory()
+    try:
+        products = []
+        for product in history.find(args.price_history):
+            key = product.pop('fingerprint')
+            product['stats'] = history.stats(key, args.history_days)
+            product['prices'] = [
+                {'ts': ts, 'discountedPrice': discounted, 'originalPrice': original}
+                for ts, discounted, original in history.history(key, args.history_days)
+            ]
+            products.append(product)
+    finally:
+        history.close()
+    print(json.dumps(products, indent=2))
+    return 0 if products else 1
+
+
+def write_stats(memo, delta_filter):
+    if memo:
+        sys.stderr.write(f"Memo: {json.dumps(memo.stats.as_dict())}\n")
+    if delta_filter:
+        sys.stderr.write(f"Delta: {json.dumps(delta_filter.stats())}\n")
+
+
+def write_metrics(path, metrics):
+    if path:
+        with open(path, 'w') as f:
+            json.dump(metrics.as_dict(), f, indent=2)
@@ -0,0 +1,79 @@
+from .deal import FIELDS, JSON_FIELDS, ROW
+
+DICTIONARY_FIELDS = ('platform', 'category')
+ARROW_BATCH_SIZE = 4096
+COLUMNAR_BATCH_SIZE = 1000
+
+
+def columns(deals):
+    """Pack ``deals`` into a ``columns`` record: one list per field instead of one object per deal.
+
+    ``platform`` and ``category`` are dictionary-encoded: their columns hold
+    indexes into the matching list under ``dictionaries``.
+    """
+    packed = {}
+    dictionaries = {}
+    for field, name, values in zip(FIELDS, JSON_FIELDS, zip(*map(ROW, deals))):
+        if field in DICTIONARY_FIELDS:
+            index = {}
+            packed[name] = [index.setdefault(value, len(index)) for value in values]
+            dictionaries[name] = list(index)
+        else:
+            packed[name] = list(values)
+    return {'type': 'columns', 'count': len(deals), 'columns': packed, 'dictionaries': dictionaries}
+
+
+class ArrowWriter:
+    """Writes deals to an Arrow IPC stream file in record batches.
+
+    ``platform`` and ``category`` are dictionary-encoded and prices are
+    64-bit integers.  Needs the optional ``pyarrow`` package.
+    """
+
+    def __init__(self, path, batch_size=ARROW_BATCH_SIZE):
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            raise RuntimeError('Arrow output needs the pyarrow package') from None
+        self.pa = pyarrow
+        self.batch_size = batch_size
+        self.batch = []
+        self.count = 0
+        string = pyarrow.string()
+        types = {
+            'platform': pyarrow.dictionary(pyarrow.int32(), string),
+            'category': pyarrow.dictionary(pyarrow.int32(), string),
+            'originalPrice': pyarrow.int64(),
+            'discountedPrice': pyarrow.int64(),
+            'discountPercentage': pyarrow.int32(),
+        }
+        self.schema = pyarrow.schema([(name, types.get(name, string)) for name in JSON_FIELDS])
+        self.writer = pyarrow.ipc.new_stream(path, self.schema)
+
+    def deal(self, deal):
+        self.batch.append(deal)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        record = columns(self.batch)
+        arrays = []
+        for field in self.schema:
+            values = record['columns'][field.name]
+            if field.name in record['dictionaries']:
+                arrays.append(self.pa.DictionaryArray.from_arrays(
+                    self.pa.array(values, self.pa.int32()),
+                    self.pa.array(record['dictionaries'][field.name], self.pa.string()),
+                ))
+            else:
+                arrays.append(self.pa.array(values, field.type))
+        self.writer.write_batch(self.pa.record_batch(arrays, schema=self.schema))
+        self.count += len(self.batch)
+        self.batch = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
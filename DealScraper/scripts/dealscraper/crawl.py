@@ -0,0 +1,90 @@
+import asyncio
+import sys
+
+from .delta import fingerprint, normalize_url
+
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_MAX_PAGES = 100
+DEFAULT_WORKERS = 4
+
+
+class Crawler:
+    """Crawls one platform outward from its seed URLs.
+
+    Pages wait in a frontier queue worked by ``workers`` tasks.  Every page
+    is parsed once for all of its cards and for the links named in the
+    platform's ``crawl_links``: pagination links keep the page's depth,
+    category links go one level deeper and are dropped past ``max_depth``.
+    URLs are deduplicated after normalization and at most ``max_pages`` are
+    ever queued, so the queue and the set of seen URLs stay bounded by the
+    page budget.  Deals are passed to ``emit`` as each page is extracted and
+    only the fingerprints of emitted deals are kept, to skip products listed
+    on more than one page.
+    """
+
+    def __init__(self, engine, platform, emit, metrics=None, max_depth=DEFAULT_MAX_DEPTH,
+                 max_pages=DEFAULT_MAX_PAGES, workers=DEFAULT_WORKERS):
+        self.engine = engine
+        self.platform = platform
+        self.emit = emit
+        self.metrics = metrics
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.workers = workers
+        self.frontier = asyncio.Queue(max_pages)
+        self.seen = set()
+        self.emitted = set()
+
+    def enqueue(self, url, depth):
+        if depth > self.max_depth or len(self.seen) >= self.max_pages:
+            return
+        key = normalize_url(url)
+        if key in self.seen:
+            return
+        self.seen.add(key)
+        self.frontier.put_nowait((url, depth))
+
+    async def crawl_page(self, url, depth):
+        platform = self.platform
+        page = self.metrics.page(platform, url) if self.metrics is not None else None
+        try:
+            deals, links = await self.engine.crawl_page(platform, url, page)
+            for deal in deals:
+                key = fingerprint(deal)
+                if key in self.emitted:
+                    continue
+                self.emitted.add(key)
+                self.emit(deal)
+                if page is not None:
+                    page.emitted += 1
+            for kind, link in links:
+                self.enqueue(link, depth if kind == 'pagination' else depth + 1)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            if page is not None:
+                page.error = error
+            sys.stderr.write(f"Error crawling {platform.label} {url}: {error}\n")
+        finally:
+            if page is not None:
+                page.finish()
+
+    async def work(self):
+        while True:
+            url, depth = await self.frontier.get()
+            try:
+                await self.crawl_page(url, depth)
+            finally:
+                self.frontier.task_done()
+
+    async def run(self):
+        """Crawl until the frontier is empty; returns the number of deals emitted."""
+        for url in self.platform.urls:
+            self.enqueue(url, 0)
+        workers = [asyncio.ensure_future(self.work()) for _ in range(self.workers)]
+        try:
+            await self.frontier.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return len(self.emitted)
@@ -0,0 +1,60 @@
+import json
+import sys
+from dataclasses import dataclass
+from operator import attrgetter
+
+
+@dataclass(slots=True)
+class Deal:
+    """One scraped deal, with prices in paise.
+
+    Slotted so large crawls hold no per-deal ``__dict__``; ``platform`` and
+    ``category`` come from small vocabularies and are interned so every deal
+    shares the same string objects.  :meth:`as_dict` is the JSON record
+    shape the server ingests.
+    """
+
+    title: str
+    platform: str
+    category: str
+    original_price: int
+    discounted_price: int
+    discount_percentage: int
+    image_url: str | None
+    deal_url: str
+    expires_at: str | None = None
+
+    def __post_init__(self):
+        self.platform = sys.intern(self.platform)
+        self.category = sys.intern(self.category)
+
+    def as_dict(self):
+        return dict(zip(JSON_FIELDS, ROW(self)))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data[field] for field in JSON_FIELDS))
+
+
+FIELDS = Deal.__slots__
+JSON_FIELDS = (
+    'title', 'platform', 'category', 'originalPrice', 'discountedPrice',
+    'discountPercentage', 'imageUrl', 'dealUrl', 'expiresAt',
+)
+ROW = attrgetter(*FIELDS)
+
+
+def encode(value):
+    """``json.dumps`` hook writing deals as their JSON records."""
+    if isinstance(value, Deal):
+        return value.as_dict()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(value):
+    return json.dumps(value, default=encode)
+
+
+def loads(text):
+    """Inverse of :func:`dumps` for payloads whose only JSON objects are deals."""
+    return json.loads(text, object_hook=Deal.from_dict)
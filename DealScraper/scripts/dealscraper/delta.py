@@ -0,0 +1,145 @@
+import hashlib
+import re
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .state import connect, state_path
+
+DEFAULT_MAX_AGE = 24 * 60 * 60
+DEFAULT_RETENTION = 30 * 24 * 60 * 60
+
+TRACKING_PARAM_RE = re.compile(r'utm_\w+|ref_?|tag|pf_rd_\w+|pd_rd_\w+|qid|sr|spm|affid|affExtParam\d*|_encoding')
+AMAZON_REF_RE = re.compile(r'/ref=[^/]*$')
+SPACE_RE = re.compile(r'\s+')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS fingerprints (
+    fingerprint BLOB PRIMARY KEY,
+    discounted_price INTEGER NOT NULL,
+    original_price INTEGER NOT NULL,
+    discount_percentage INTEGER NOT NULL,
+    emitted_at REAL NOT NULL,
+    seen_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fingerprints_seen_at ON fingerprints (seen_at);
+'''
+
+
+def normalize_url(url):
+    """Drop tracking parameters, fragments and case differences from a deal URL."""
+    parts = urlsplit(url.strip())
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not TRACKING_PARAM_RE.fullmatch(key))
+    path = AMAZON_REF_RE.sub('', parts.path).rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def fingerprint(deal):
+    """Stable identity of a deal: its normalized URL plus its normalized title."""
+    title = SPACE_RE.sub(' ', deal.title).strip().casefold()
+    key = f"{normalize_url(deal.deal_url)}\0{title}"
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+def _prices(deal):
+    return deal.discounted_price, deal.original_price, deal.discount_percentage
+
+
+class DeltaIndex:
+    """Persisted fingerprints of the deals already emitted, with their prices.
+
+    :meth:`check` classifies a deal as ``new``, ``changed`` (its prices
+    moved), ``stale`` (unchanged but last emitted more than ``max_age``
+    seconds ago, so downstream stores that lost it get it back) or ``None``
+    when it can be skipped.  Updates are buffered until :meth:`flush`;
+    fingerprints not seen for ``retention`` seconds are dropped.
+    """
+
+    def __init__(self, path=None, max_age=DEFAULT_MAX_AGE, retention=DEFAULT_RETENTION):
+        self.max_age = max_age
+        self.retention = retention
+        self.db = connect(path or state_path('delta.sqlite3'))
+        self.db.executescript(SCHEMA)
+        self._emitted = {}
+        self._seen = set()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def check(self, deal):
+        key = fingerprint(deal)
+        prices = _prices(deal)
+        pending = self._emitted.get(key)
+        if pending is not None:
+            change = None if pending == prices else 'changed'
+        else:
+            row = self.db.execute(
+                'SELECT discounted_price, original_price, discount_percentage, emitted_at '
+                'FROM fingerprints WHERE fingerprint = ?', (key,)
+            ).fetchone()
+            if row is None:
+                change = 'new'
+            elif tuple(row[:3]) != prices:
+                change = 'changed'
+            elif time.time() - row[3] > self.max_age:
+                change = 'stale'
+            else:
+                change = None
+        if change is None:
+            self._seen.add(key)
+        else:
+            self._emitted[key] = prices
+        return change
+
+    def record(self, deal):
+        """Mark ``deal`` as emitted without checking it."""
+        self._emitted[fingerprint(deal)] = _prices(deal)
+
+    def flush(self):
+        if not self._emitted and not self._seen:
+            return
+        now = time.time()
+        self.db.execute('BEGIN')
+        self.db.executemany(
+            'INSERT OR REPLACE INTO fingerprints '
+            '(fingerprint, discounted_price, original_price, discount_percentage, emitted_at, seen_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            ((key, *prices, now, now) for key, prices in self._emitted.items()),
+        )
+        self.db.executemany('UPDATE fingerprints SET seen_at = ? WHERE fingerprint = ?',
+                            ((now, key) for key in self._seen - self._emitted.keys()))
+        self.db.execute('DELETE FROM fingerprints WHERE seen_at < ?', (now - self.retention,))
+        self.db.execute('COMMIT')
+        self._emitted.clear()
+        self._seen.clear()
+
+
+class DeltaFilter:
+    """Wraps an ``emit`` callback so only new or changed deals reach it.
+
+    With ``skip_unchanged`` false every deal is passed through but still
+    recorded, which reseeds the index after a downstream store was reset.
+    """
+
+    def __init__(self, index, emit, skip_unchanged=True):
+        self.index = index
+        self.emit = emit
+        self.skip_unchanged = skip_unchanged
+        self.emitted = 0
+        self.counts = {'new': 0, 'changed': 0, 'stale': 0, 'unchanged': 0}
+
+    def __call__(self, deal):
+        if self.skip_unchanged:
+            change = self.index.check(deal)
+        else:
+            change = self.index.check(deal) or 'unchanged'
+            self.index.record(deal)
+        self.counts[change or 'unchanged'] += 1
+        if change is None:
+            return
+        self.emitted += 1
+        self.emit(deal)
+
+    def stats(self):
+        return dict(self.counts)
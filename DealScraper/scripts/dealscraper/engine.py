@@ -0,0 +1,383 @@
+import asyncio
+import sys
+from contextlib import aclosing, asynccontextmanager
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .crawl import Crawler
+from .incremental import CardStream
+from .memo import MISSING
+from .metrics import trace_config
+from .parallel import extract_page, parse_pool
+from .platforms import PLATFORMS, get_platform
+from .throttle import RETRY_STATUSES, RetriesExhausted
+
+POOL_SIZE = 16
+PER_HOST = 2
+CHUNK_SIZE = 16 * 1024
+
+
+class Engine:
+    """Fetches platform pages concurrently over one shared connection pool.
+
+    The pool is bounded by ``pool_size`` connections in total and by
+    ``per_host`` in-flight requests for any single host, so a refresh costs
+    roughly the latency of its slowest page rather than the sum of them all.
+
+    ``origin`` redirects every request to a mirror such as a local fixture
+    server: ``https://www.amazon.in/deals`` is fetched from
+    ``<origin>/www.amazon.in/deals``.
+
+    With ``incremental`` set, bodies are parsed while they download and the
+    connection is dropped as soon as the platform's card limit or deal quota
+    is reached, instead of reading and parsing the whole page first.
+
+    ``cache`` is an optional :class:`~dealscraper.httpcache.HttpCache`; pages
+    it holds are replayed or revalidated instead of downloaded and parsed.
+    Its entries are keyed by the URL actually fetched, so engines pointed at
+    different origins never replay each other's pages.
+    ``memo`` is an optional :class:`~dealscraper.memo.MemoStore`; pages and
+    cards whose markup was seen before reuse their extracted deals.
+
+    :meth:`crawl` follows pagination and category links beyond the seed
+    URLs instead; see :class:`~dealscraper.crawl.Crawler`.
+
+    With ``parse_workers``, downloaded pages are parsed and extracted in a
+    pool of that many worker processes (threads on a free-threaded
+    interpreter) while the event loop keeps fetching and emitting; deals
+    still reach ``emit`` from the event loop only.  Incrementally parsed
+    pages are not handed to the pool, and workers skip the card memo.
+
+    ``throttle`` is an optional :class:`~dealscraper.throttle.Throttle`:
+    requests then wait for their host's token bucket, throttled, failed and
+    timed-out requests are retried with backoff, other error responses
+    such as a 403 count against the host without being retried, and hosts
+    whose circuit breaker is open fail fast instead of being requested at
+    all.
+    """
+
+    def __init__(self, pool_size=POOL_SIZE, per_host=PER_HOST, origin=None, incremental=False,
+                 cache=None, memo=None, parse_workers=0, throttle=None):
+        self.pool_size = pool_size
+        self.per_host = per_host
+        self.origin = origin.rstrip('/') if origin else None
+        self.incremental = incremental
+        self.cache = cache
+        self.memo = memo
+        self.parse_workers = parse_workers
+        self.throttle = throttle
+        self.parse_pool = None
+        self.session = None
+        self._host_slots = {}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.per_host,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, trace_configs=[trace_config()])
+        if self.parse_workers and self.parse_pool is None:
+            self.parse_pool = parse_pool(self.parse_workers)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+        if self.memo:
+            self.memo.flush()
+
+    def _slot(self, url):
+        host = urlsplit(url).hostname
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return slot
+
+    def resolve(self, url):
+        if not self.origin:
+            return url
+        parts = urlsplit(url)
+        resolved = f"{self.origin}/{parts.hostname}{parts.path or '/'}"
+        if parts.query:
+            resolved += '?' + parts.query
+        return resolved
+
+    @asynccontextmanager
+    async def _get(self, platform, url, headers, metrics=None):
+        """Open a GET of ``url`` within its host slot, retrying through the throttle if there is one.
+
+        Only opening the response is retried: once it is handed over its
+        body may already be partly consumed.  Raises
+        :class:`~dealscraper.throttle.CircuitOpen` or
+        :class:`~dealscraper.throttle.RetriesExhausted` when the host is
+        given up on.
+        """
+        throttle = self.throttle
+        host = urlsplit(url).hostname
+        timeout = aiohttp.ClientTimeout(total=platform.timeout)
+        attempt = 0
+        while True:
+            trial = await throttle.acquire(host) if throttle is not None else False
+            try:
+                async with self._slot(url):
+                    try:
+                        response = await self.session.get(self.resolve(url), headers=headers, timeout=timeout,
+                                                          trace_request_ctx=metrics)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        if throttle is None:
+                            raise
+                        response = None
+                        failure = str(e) or type(e).__name__
+                    if response is not None:
+                        if throttle is None or response.status not in RETRY_STATUSES:
+                            if throttle is not None:
+                                # Other errors such as a 403 are not worth
+                                # retrying but still count against the host.
+                                if 200 <= response.status < 300 or response.status == 304:
+                                    throttle.succeeded(host)
+                                else:
+                                    throttle.rejected(host)
+                                trial = False
+                            async with response:
+                                yield response
+                            return
+                        failure = f"HTTP {response.status}"
+                        retry_after = response.headers.get('Retry-After')
+                        response.release()
+                    else:
+                        retry_after = None
+            except BaseException:
+                # A cancelled or crashed trial must not leave the breaker
+                # waiting on it for good.
+                if trial:
+                    throttle.end_trial(host)
+                raise
+            delay = throttle.failed(host, attempt, throttled=response is not None and response.status == 429,
+                                    retry_after=retry_after)
+            if delay is None:
+                raise RetriesExhausted(f"{host}: {failure} after {attempt + 1} attempts")
+            attempt += 1
+            if metrics is not None:
+                metrics.retries = attempt
+            await asyncio.sleep(delay)
+
+    async def page_deals(self, platform, url, metrics=None):
+        """Yield the deals on ``url``, replaying them from the cache when possible.
+
+        ``metrics`` is an optional :class:`~dealscraper.metrics.PageMetrics`
+        filled in with the page's timings and card counts.
+        """
+        key = self.resolve(url)
+        entry = self.cache.get(key) if self.cache else None
+        if entry is not None and entry.fresh:
+            if metrics is not None:
+                metrics.source = 'cache'
+                metrics.deals = len(entry.deals)
+            for deal in entry.deals:
+                yield deal
+            return
+
+        headers = platform.headers
+        if entry is not None:
+            headers = {**headers, **entry.validators()}
+
+        async with self._get(platform, url, headers, metrics) as response:
+            if metrics is not None:
+                metrics.status = response.status
+            if response.status == 304 and entry is not None:
+                self.cache.revalidated(key)
+                if metrics is not None:
+                    metrics.source = 'revalidated'
+                    metrics.deals = len(entry.deals)
+                for deal in entry.deals:
+                    yield deal
+                return
+            if response.status != 200:
+                return
+
+            deals = []
+            async for deal in self._extract(platform, response, metrics):
+                deals.append(deal)
+                yield deal
+            if self.cache:
+                self.cache.store(key, response.headers, deals)
+
+    async def _extract(self, platform, response, metrics=None):
+        if not self.incremental:
+            content = await response.read()
+            if metrics is not None:
+                metrics.bytes = len(content)
+            if self.parse_pool is not None:
+                deals = await self._pool_deals(platform, content, metrics)
+            else:
+                deals = platform.iter_deals(content, self.memo, metrics)
+            for deal in deals:
+                yield deal
+            return
+
+        cards = CardStream(platform, response.charset, self.memo, metrics)
+        try:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                for deal in cards.feed(chunk):
+                    yield deal
+                if cards.exhausted:
+                    return
+            for deal in cards.close():
+                yield deal
+        finally:
+            if metrics is not None:
+                metrics.bytes = cards.bytes_fed
+
+    async def stream_platform(self, platform, emit, metrics=None):
+        """Scrape ``platform``, calling ``emit(deal)`` as soon as each card is parsed.
+
+        Pages are extracted in the order they finish downloading and the
+        platform's ``max_deals`` quota is shared between them.  Returns the
+        number of deals emitted.  ``metrics`` is an optional
+        :class:`~dealscraper.metrics.Metrics` that collects every page.
+        """
+        if isinstance(platform, str):
+            platform = get_platform(platform)
+
+        emitted = 0
+
+        async def scrape_page(url):
+            nonlocal emitted
+            page = metrics.page(platform, url) if metrics is not None else None
+            try:
+                async with aclosing(self.page_deals(platform, url, page)) as deals:
+                    async for deal in deals:
+                        if emitted < platform.max_deals:
+                            emitted += 1
+                            emit(deal)
+                            if page is not None:
+                                page.emitted += 1
+                        # With a cache, finish the page so its entry holds
+                        # every deal; otherwise stop reading it right away.
+                        if emitted >= platform.max_deals and self.cache is None:
+                            break
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if page is not None:
+                    page.error = error
+                sys.stderr.write(f"Error scraping {platform.label}: {error}\n")
+            finally:
+                if page is not None:
+                    page.finish()
+
+        await asyncio.gather(*(scrape_page(url) for url in platform.urls))
+        if self.memo:
+            self.memo.flush()
+        return emitted
+
+    async def _parse_in_pool(self, platform, content, url=None, metrics=None, crawl=False):
+        loop = asyncio.get_running_loop()
+        deals, links, parsed = await loop.run_in_executor(
+            self.parse_pool, extract_page, platform.name, content, url, crawl)
+        if metrics is not None:
+            metrics.merge(parsed)
+        return deals, links
+
+    async def _pool_deals(self, platform, content, metrics=None):
+        key, deals = self.memo.page(platform, content) if self.memo else (None, MISSING)
+        if deals is not MISSING:
+            if metrics is not None:
+                metrics.memo = True
+                metrics.deals = len(deals)
+            return deals
+        deals, _ = await self._parse_in_pool(platform, content, metrics=metrics)
+        if self.memo:
+            self.memo.put(key, deals)
+        return deals
+
+    async def crawl_page(self, platform, url, metrics=None):
+        """Fetch ``url`` whole and return its deals and the links to crawl from it.
+
+        Crawled pages bypass the cache, which only stores deals, and are
+        never cut short, since links can appear anywhere on the page.
+        """
+        async with self._get(platform, url, platform.headers, metrics) as response:
+            if metrics is not None:
+                metrics.status = response.status
+            if response.status != 200:
+                return [], []
+            content = await response.read()
+        if metrics is not None:
+            metrics.bytes = len(content)
+        if self.parse_pool is not None:
+            return await self._parse_in_pool(platform, content, url, metrics, crawl=True)
+        return platform.crawl_page(content, url, self.memo, metrics)
+
+    async def crawl_platform(self, platform, emit, metrics=None, **budget):
+        """Crawl ``platform``, calling ``emit(deal)`` as each page is extracted.
+
+        ``budget`` is passed on to :class:`~dealscraper.crawl.Crawler`
+        (``max_depth``, ``max_pages``, ``workers``).  Returns the number of
+        deals emitted.
+        """
+        if isinstance(platform, str):
+            platform = get_platform(platform)
+        emitted = await Crawler(self, platform, emit, metrics, **budget).run()
+        if self.memo:
+            self.memo.flush()
+        return emitted
+
+    async def crawl(self, names, emit, metrics=None, **budget):
+        names = list(names or PLATFORMS)
+        counts = await asyncio.gather(*(self.crawl_platform(name, emit, metrics, **budget) for name in names))
+        return sum(counts)
+
+    async def stream(self, names, emit, metrics=None):
+        names = list(names or PLATFORMS)
+        counts = await asyncio.gather(*(self.stream_platform(name, emit, metrics) for name in names))
+        return sum(counts)
+
+    async def scrape_platform(self, platform, metrics=None):
+        deals = []
+        await self.stream_platform(platform, deals.append, metrics)
+        return deals
+
+    async def scrape(self, names=None, metrics=None):
+        names = list(names or PLATFORMS)
+        results = await asyncio.gather(*(self.scrape_platform(name, metrics) for name in names))
+        return dict(zip(names, results))
+
+
+async def _scrape(names, metrics=None, **options):
+    async with Engine(**options) as engine:
+        return await engine.scrape(names, metrics)
+
+
+def scrape(names=None, metrics=None, **options):
+    return asyncio.run(_scrape(names, metrics, **options))
+
+
+async def _stream(names, emit, metrics=None, **options):
+    async with Engine(**options) as engine:
+        return await engine.stream(names, emit, metrics)
+
+
+def stream(names, emit, metrics=None, **options):
+    return asyncio.run(_stream(names, emit, metrics, **options))
+
+
+async def _crawl(names, emit, metrics=None, budget=None, **options):
+    async with Engine(**options) as engine:
+        return await engine.crawl(names, emit, metrics, **(budget or {}))
+
+
+def crawl(names, emit, metrics=None, budget=None, **options):
+    return asyncio.run(_crawl(names, emit, metrics, budget, **options))
@@ -0,0 +1,168 @@
+import statistics
+import time
+
+from .delta import fingerprint, normalize_url
+from .state import connect, state_path
+
+DAY = 24 * 60 * 60
+DEFAULT_DAYS = 90
+DEFAULT_RETENTION = 365 * DAY
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS observations (
+    fingerprint BLOB NOT NULL,
+    ts INTEGER NOT NULL,
+    discounted_price INTEGER NOT NULL,
+    original_price INTEGER NOT NULL,
+    PRIMARY KEY (fingerprint, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS products (
+    fingerprint BLOB PRIMARY KEY,
+    platform TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS products_url ON products (url);
+CREATE INDEX IF NOT EXISTS products_last_seen ON products (last_seen);
+'''
+
+
+class PriceHistory:
+    """Every price a deal was seen at, kept as a time series across runs.
+
+    Each observation is a row keyed by the deal's
+    :func:`~dealscraper.delta.fingerprint` and the second it was seen, so
+    the history, lowest price and median of one deal over any window are a
+    single range scan of the primary key however many rows the store holds.
+    Observations are buffered until :meth:`flush`; when the store is opened,
+    deals not seen for ``retention`` seconds are dropped with their history.
+    """
+
+    def __init__(self, path=None, retention=DEFAULT_RETENTION):
+        self.db = connect(path or state_path('history.sqlite3'))
+        self.db.executescript(SCHEMA)
+        self._pending = {}
+        if retention:
+            self.prune(time.time() - retention)
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def add(self, deal, ts=None):
+        ts = int(ts or time.time())
+        self._pending[fingerprint(deal), ts] = deal
+
+    def recorder(self, emit):
+        """Wrap ``emit`` so every deal passed to it is also recorded."""
+        def record(deal):
+            self.add(deal)
+            emit(deal)
+        return record
+
+    def flush(self):
+        if not self._pending:
+            return
+        self.db.execute('BEGIN')
+        self.db.executemany(
+            'INSERT OR REPLACE INTO observations (fingerprint, ts, discounted_price, original_price) '
+            'VALUES (?, ?, ?, ?)',
+            ((key, ts, deal.discounted_price, deal.original_price) for (key, ts), deal in self._pending.items()),
+        )
+        self.db.executemany(
+            'INSERT INTO products (fingerprint, platform, title, url, first_seen, last_seen) '
+            'VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (fingerprint) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen)',
+            ((key, deal.platform, deal.title, normalize_url(deal.deal_url), ts, ts)
+             for (key, ts), deal in self._pending.items()),
+        )
+        self.db.execute('COMMIT')
+        self._pending.clear()
+
+    def prune(self, before):
+        """Drop the deals last seen before ``before`` (a Unix time) and their observations."""
+        before = int(before)
+        self.db.execute('BEGIN')
+        self.db.execute(
+            'DELETE FROM observations WHERE fingerprint IN '
+            '(SELECT fingerprint FROM products WHERE last_seen < ?)', (before,)
+        )
+        self.db.execute('DELETE FROM products WHERE last_seen < ?', (before,))
+        self.db.execute('COMMIT')
+
+    def find(self, url):
+        """Products whose normalized deal URL is ``url``, most recently seen first."""
+        rows = self.db.execute(
+            'SELECT fingerprint, platform, title, url, first_seen, last_seen FROM products '
+            'WHERE url = ? ORDER BY last_seen DESC', (normalize_url(url),)
+        )
+        return [
+            {'fingerprint': key, 'platform': platform, 'title': title, 'url': url,
+             'firstSeen': first_seen, 'lastSeen': last_seen}
+            for key, platform, title, url, first_seen, last_seen in rows
+        ]
+
+    def history(self, key, days=None):
+        """``(ts, discounted_price, original_price)`` rows of a deal or fingerprint, oldest first."""
+        return self.db.execute(
+            'SELECT ts, discounted_price, original_price FROM observations '
+            'WHERE fingerprint = ? AND ts >= ? ORDER BY ts', (_key(key), _since(days))
+        ).fetchall()
+
+    def lowest(self, key, days=DEFAULT_DAYS):
+        """Lowest price the deal was seen at in the last ``days`` days, or ``None``."""
+        return self.db.execute(
+            'SELECT MIN(discounted_price) FROM observations WHERE fingerprint = ? AND ts >= ?',
+            (_key(key), _since(days))
+        ).fetchone()[0]
+
+    def median(self, key, days=DEFAULT_DAYS):
+        """Median price of the deal's observations in the last ``days`` days, or ``None``."""
+        prices = [price for price, in self.db.execute(
+            'SELECT discounted_price FROM observations WHERE fingerprint = ? AND ts >= ?',
+            (_key(key), _since(days))
+        )]
+        return statistics.median(prices) if prices else None
+
+    def stats(self, key, days=DEFAULT_DAYS, price=None):
+        """How a price compares with the deal's own history over the last ``days`` days.
+
+        ``price`` defaults to the latest observation.  ``realDiscount`` is
+        the percentage it sits below the median price, next to the
+        ``claimedDiscount`` from the listed original price; a claimed
+        discount well above the real one marks an inflated original price.
+        Returns ``None`` when the deal has no observations in the window.
+        """
+        rows = self.history(key, days)
+        if not rows:
+            return None
+        _, latest, original = rows[-1]
+        if price is None:
+            price = latest
+        prices = [row[1] for row in rows]
+        median = statistics.median(prices)
+        return {
+            'observations': len(rows),
+            'price': price,
+            'lowestPrice': min(prices),
+            'medianPrice': median,
+            'realDiscount': round((median - price) / median * 100) if median else 0,
+            'claimedDiscount': round((original - latest) / original * 100) if original else 0,
+        }
+
+    def real_discount(self, deal, days=DEFAULT_DAYS):
+        """:meth:`stats` for ``deal`` at its current price against its recorded history."""
+        stats = self.stats(deal, days, deal.discounted_price)
+        if stats is not None:
+            stats['claimedDiscount'] = deal.discount_percentage
+        return stats
+
+
+def _key(key):
+    return key if isinstance(key, bytes) else fingerprint(key)
+
+
+def _since(days):
+    return int(time.time() - days * DAY) if days else 0
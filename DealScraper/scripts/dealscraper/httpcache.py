@@ -0,0 +1,100 @@
+import time
+
+from .deal import dumps, loads
+from .state import connect, state_path
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    deals TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at);
+'''
+
+
+class CacheEntry:
+    def __init__(self, url, etag, last_modified, fetched_at, deals, ttl):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.deals = deals
+        self.ttl = ttl
+
+    @property
+    def fresh(self):
+        return time.time() - self.fetched_at < self.ttl
+
+    def validators(self):
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """On-disk cache of the deals extracted from each page URL.
+
+    Entries younger than ``ttl`` seconds are replayed without touching the
+    network.  Older ones are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``, and a 304 replays the stored deals without
+    re-parsing.  The stored payload is kept under ``max_bytes`` by evicting
+    the least recently used pages.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.db = connect(path or state_path('httpcache.sqlite3'))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def get(self, url):
+        row = self.db.execute(
+            'SELECT etag, last_modified, fetched_at, deals FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.db.execute('UPDATE pages SET accessed_at = ? WHERE url = ?', (time.time(), url))
+        etag, last_modified, fetched_at, deals = row
+        return CacheEntry(url, etag, last_modified, fetched_at, loads(deals), self.ttl)
+
+    def revalidated(self, url):
+        self.db.execute('UPDATE pages SET fetched_at = ? WHERE url = ?', (time.time(), url))
+
+    def store(self, url, headers, deals):
+        if 'no-store' in headers.get('Cache-Control', ''):
+            return
+        payload = dumps(deals)
+        now = time.time()
+        self.db.execute(
+            'INSERT OR REPLACE INTO pages (url, etag, last_modified, fetched_at, accessed_at, size, deals) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (url, headers.get('ETag'), headers.get('Last-Modified'), now, now, len(payload), payload),
+        )
+        self.evict()
+
+    def evict(self):
+        (total,) = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM pages').fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims = []
+        for url, size in self.db.execute('SELECT url, size FROM pages ORDER BY accessed_at'):
+            victims.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.db.executemany('DELETE FROM pages WHERE url = ?', victims)
@@ -0,0 +1,97 @@
+import time
+
+from lxml import etree
+
+from .selectors import sniff_encoding
+
+
+class CardStream:
+    """Extracts deals from a page while it is still downloading.
+
+    Page bytes are fed to an lxml pull parser that only reports elements
+    with the card's tag names.  Cards are numbered by their opening tag, as
+    the XPath selector orders them, so the same first ``limit`` cards are
+    extracted even when cards nest; each is handed to ``parse_card`` once
+    its closing tag has been parsed, and deals are yielded in that same
+    order.  Reported elements outside any open card are cleared once they
+    close, so the tree holds little more than the card currently being
+    built.  ``exhausted`` turns true once every card within the platform's
+    card limit has been extracted; callers should stop reading the body at
+    that point.
+    """
+
+    def __init__(self, platform, encoding=None, memo=None, metrics=None):
+        self.platform = platform
+        self.memo = memo
+        self.metrics = metrics
+        (self.card,) = platform.selectors['cards']
+        self.encoding = encoding
+        self.parser = None
+        self.open_cards = {}
+        self.cards_started = 0
+        self.cards_seen = 0
+        self.bytes_fed = 0
+        self._done = {}
+        self._next = 0
+
+    @property
+    def exhausted(self):
+        limit = self.card.limit
+        return limit is not None and self.cards_seen >= limit
+
+    def feed(self, chunk):
+        if self.parser is None:
+            self.parser = etree.HTMLPullParser(
+                events=('start', 'end'),
+                tag=self.card.tags,
+                encoding=self.encoding or sniff_encoding(chunk),
+            )
+        self.bytes_fed += len(chunk)
+        start = time.perf_counter()
+        self.parser.feed(chunk)
+        self._parsed(start)
+        return self._drain()
+
+    def close(self):
+        if self.parser is None:
+            return iter(())
+        start = time.perf_counter()
+        self.parser.close()
+        self._parsed(start)
+        return self._drain()
+
+    def _parsed(self, start):
+        if self.metrics is not None:
+            self.metrics.parse += time.perf_counter() - start
+
+    def _drain(self):
+        limit = self.card.limit
+        for event, element in self.parser.read_events():
+            if self.exhausted:
+                return
+            is_card = self.card.matches(element)
+            if event == 'start':
+                if is_card:
+                    self.open_cards[element] = self.cards_started
+                    self.cards_started += 1
+                continue
+
+            if is_card:
+                index = self.open_cards.pop(element)
+                if limit is None or index < limit:
+                    self._done[index] = self.platform.deal_from_card(element, self.memo, self.metrics)
+                    # Nested cards close before the card around them; hold
+                    # their deals back until every earlier card is done.
+                    while self._next in self._done:
+                        deal = self._done.pop(self._next)
+                        self._next += 1
+                        self.cards_seen += 1
+                        if deal:
+                            yield deal
+
+            if not self.open_cards:
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
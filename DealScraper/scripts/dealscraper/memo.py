@@ -0,0 +1,163 @@
+import hashlib
+import inspect
+import sys
+import time
+
+from .deal import dumps, loads
+from .state import connect, state_path
+
+DEFAULT_MAX_ENTRIES = 100_000
+MISSING = object()
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS memo (
+    key BLOB PRIMARY KEY,
+    value TEXT NOT NULL,
+    used_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS memo_used_at ON memo (used_at);
+'''
+
+
+def _extraction_modules(platform):
+    """The modules defining ``platform``'s classes and the package helpers they import."""
+    package = __name__.rpartition('.')[0] + '.'
+    modules = {}
+    for cls in type(platform).__mro__:
+        module = sys.modules[cls.__module__]
+        if not module.__name__.startswith(package):
+            continue
+        modules[module.__name__] = module
+        for value in vars(module).values():
+            name = getattr(value, '__module__', None) or getattr(value, '__name__', '')
+            if isinstance(name, str) and name.startswith(package) and name in sys.modules:
+                modules.setdefault(name, sys.modules[name])
+    return [modules[name] for name in sorted(modules)]
+
+
+class MemoStats:
+    def __init__(self):
+        self.page_hits = 0
+        self.page_misses = 0
+        self.card_hits = 0
+        self.card_misses = 0
+        self.parse_seconds = 0.0
+
+    def as_dict(self):
+        cards = self.card_hits + self.card_misses
+        pages = self.page_hits + self.page_misses
+        per_card = self.parse_seconds / self.card_misses if self.card_misses else 0.0
+        return {
+            'pageHits': self.page_hits,
+            'pageMisses': self.page_misses,
+            'cardHits': self.card_hits,
+            'cardMisses': self.card_misses,
+            'pageHitRate': round(self.page_hits / pages, 3) if pages else 0.0,
+            'cardHitRate': round(self.card_hits / cards, 3) if cards else 0.0,
+            'parseMs': round(self.parse_seconds * 1000, 2),
+            'savedParseMs': round(self.card_hits * per_card * 1000, 2),
+        }
+
+    def since(self, earlier):
+        delta = MemoStats()
+        for field in vars(self):
+            setattr(delta, field, getattr(self, field) - getattr(earlier, field))
+        return delta
+
+    def copy(self):
+        return self.since(MemoStats())
+
+
+class MemoStore:
+    """Bounded, persistent memo of extraction results keyed by content hash.
+
+    Whole pages are keyed by a hash of their body and single cards by a hash
+    of their outer HTML, both salted with the source of the platform's
+    classes and the helpers they use, so a code change never replays stale
+    results.  Cards that yield no deal are remembered too, along with the
+    reason they were dropped.  Writes are buffered until :meth:`flush` and
+    the store is trimmed to ``max_entries`` by least recent use.
+    """
+
+    def __init__(self, path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.db = connect(path or state_path('memo.sqlite3'))
+        self.db.executescript(SCHEMA)
+        self.stats = MemoStats()
+        self._pending = {}
+        self._touched = set()
+        self._salts = {}
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def _salt(self, platform):
+        salt = self._salts.get(platform.name)
+        if salt is None:
+            source = ''.join(inspect.getsource(module) for module in _extraction_modules(platform))
+            salt = self._salts[platform.name] = hashlib.blake2b(
+                f'{platform.name}\0{source}'.encode(), digest_size=16
+            ).digest()
+        return salt
+
+    def key(self, platform, kind, content):
+        digest = hashlib.blake2b(content, digest_size=16, key=self._salt(platform), person=kind.encode())
+        return digest.digest()
+
+    def get(self, key):
+        if key in self._pending:
+            return self._pending[key]
+        row = self.db.execute('SELECT value FROM memo WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return MISSING
+        self._touched.add(key)
+        return loads(row[0])
+
+    def put(self, key, value):
+        self._pending[key] = value
+
+    def page(self, platform, content):
+        key = self.key(platform, 'page', content)
+        deals = self.get(key)
+        if deals is MISSING:
+            self.stats.page_misses += 1
+        else:
+            self.stats.page_hits += 1
+        return key, deals
+
+    def card(self, platform, card_html, parse):
+        key = self.key(platform, 'card', card_html)
+        deal = self.get(key)
+        if deal is not MISSING:
+            self.stats.card_hits += 1
+            return deal
+        start = time.perf_counter()
+        deal = parse()
+        self.stats.parse_seconds += time.perf_counter() - start
+        self.stats.card_misses += 1
+        self.put(key, deal)
+        return deal
+
+    def flush(self):
+        if not self._pending and not self._touched:
+            return
+        now = time.time()
+        self.db.execute('BEGIN')
+        self.db.executemany(
+            'INSERT OR REPLACE INTO memo (key, value, used_at) VALUES (?, ?, ?)',
+            ((key, dumps(value), now) for key, value in self._pending.items()),
+        )
+        self.db.executemany('UPDATE memo SET used_at = ? WHERE key = ?', ((now, key) for key in self._touched))
+        self.db.execute('COMMIT')
+        self._pending.clear()
+        self._touched.clear()
+        self.evict()
+
+    def evict(self):
+        (count,) = self.db.execute('SELECT COUNT(*) FROM memo').fetchone()
+        if count > self.max_entries:
+            self.db.execute(
+                'DELETE FROM memo WHERE key IN (SELECT key FROM memo ORDER BY used_at LIMIT ?)',
+                (count - self.max_entries,),
+            )
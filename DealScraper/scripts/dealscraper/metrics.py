@@ -0,0 +1,139 @@
+import time
+from collections import Counter
+
+import aiohttp
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+class PageMetrics:
+    """Timings and card accounting for one page fetch.
+
+    ``source`` is ``network``, ``cache`` (replayed without a request) or
+    ``revalidated`` (a 304).  Network timings come from aiohttp tracing and
+    are ``None`` for stages that did not happen, such as DNS or connecting on
+    a reused connection; ``connect`` includes any DNS lookup it needed.
+    ``retries`` counts the attempts repeated after a throttled or failed
+    request, and the timings are those of the last attempt.
+    """
+
+    def __init__(self, platform, url):
+        self.platform = platform
+        self.url = url
+        self.source = 'network'
+        self.status = None
+        self.retries = 0
+        self.memo = False
+        self.started = time.perf_counter()
+        self.request_started = None
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.bytes = 0
+        self.parse = 0.0
+        self.extract = 0.0
+        self.cards = 0
+        self.deals = 0
+        self.emitted = 0
+        self.dropped = Counter()
+        self.error = None
+
+    def card(self, reason, seconds):
+        self.cards += 1
+        self.extract += seconds
+        if reason is None:
+            self.deals += 1
+        else:
+            self.dropped[reason] += 1
+
+    def merge(self, other):
+        """Add the parse and card counters of ``other``, filled in by a parse worker."""
+        self.parse += other.parse
+        self.extract += other.extract
+        self.cards += other.cards
+        self.deals += other.deals
+        self.dropped.update(other.dropped)
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            'platform': self.platform,
+            'url': self.url,
+            'source': self.source,
+            'status': self.status,
+            'retries': self.retries,
+            'memo': self.memo,
+            'dnsMs': _ms(self.dns),
+            'connectMs': _ms(self.connect),
+            'ttfbMs': _ms(self.ttfb),
+            'totalMs': _ms(self.total),
+            'bytes': self.bytes,
+            'parseMs': _ms(self.parse),
+            'extractMs': _ms(self.extract),
+            'cardsSeen': self.cards,
+            'deals': self.deals,
+            'emitted': self.emitted,
+            'dropped': dict(self.dropped),
+            'error': self.error,
+        }
+
+
+class Metrics:
+    """Collects :class:`PageMetrics` for every page fetched during one scrape."""
+
+    def __init__(self):
+        self.pages = []
+
+    def page(self, platform, url):
+        page = PageMetrics(platform.name, url)
+        self.pages.append(page)
+        return page
+
+    def as_dict(self):
+        return {'pages': [page.as_dict() for page in self.pages]}
+
+
+async def _on_request_start(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.request_started = time.perf_counter()
+
+
+async def _on_dns_start(session, context, params):
+    context.dns_started = time.perf_counter()
+
+
+async def _on_dns_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.dns = time.perf_counter() - context.dns_started
+
+
+async def _on_connection_start(session, context, params):
+    context.connection_started = time.perf_counter()
+
+
+async def _on_connection_end(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.connect = time.perf_counter() - context.connection_started
+
+
+async def _on_request_end(session, context, params):
+    page = context.trace_request_ctx
+    if page is not None and page.request_started is not None:
+        page.ttfb = time.perf_counter() - page.request_started
+
+
+def trace_config():
+    """An aiohttp trace config that fills in the ``PageMetrics`` passed as ``trace_request_ctx``."""
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connection_start)
+    config.on_connection_create_end.append(_on_connection_end)
+    config.on_request_end.append(_on_request_end)
+    return config
@@ -0,0 +1,51 @@
+import json
+import sys
+
+from .columnar import columns
+from .deal import encode
+
+
+class NdjsonWriter:
+    """Writes scraper records as newline-delimited JSON, flushing every line.
+
+    Every record carries a ``type``: ``deal`` records are written as soon as
+    a card is parsed and a single ``end`` record, which may carry run
+    statistics, closes the stream.  With a ``batch_size`` above one, deals
+    are instead grouped into ``batch`` records of up to that many deals, the
+    last one written just before ``end``; with ``columnar`` set they are
+    written as ``columns`` records (see :func:`~dealscraper.columnar.columns`)
+    instead.  ``extra`` fields (such as a worker request ``id``) are added to
+    every record.
+    """
+
+    def __init__(self, stream=None, extra=None, batch_size=1, columnar=False):
+        self.stream = stream or sys.stdout
+        self.extra = extra or {}
+        self.batch_size = batch_size
+        self.columnar = columnar
+        self.batch = []
+
+    def write(self, record):
+        self.stream.write(json.dumps({**self.extra, **record}, default=encode) + '\n')
+        self.stream.flush()
+
+    def deal(self, deal):
+        if self.batch_size <= 1:
+            self.write({'type': 'deal', 'deal': deal})
+            return
+        self.batch.append(deal)
+        if len(self.batch) >= self.batch_size:
+            self.flush_batch()
+
+    def flush_batch(self):
+        if not self.batch:
+            return
+        if self.columnar:
+            self.write(columns(self.batch))
+        else:
+            self.write({'type': 'batch', 'deals': self.batch})
+        self.batch = []
+
+    def end(self, count, **stats):
+        self.flush_batch()
+        self.write({'type': 'end', 'count': count, **stats})
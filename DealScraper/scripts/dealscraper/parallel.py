@@ -0,0 +1,39 @@
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .metrics import PageMetrics
+from .platforms import PLATFORMS
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def parse_pool(workers):
+    """Executor for :func:`extract_page` with ``workers`` workers.
+
+    Threads when the interpreter runs without a GIL, since they then parse
+    in parallel without copying page bytes between processes; spawned
+    processes otherwise.
+    """
+    if not gil_enabled():
+        return ThreadPoolExecutor(workers, thread_name_prefix='parse')
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def extract_page(name, content, url=None, crawl=False):
+    """Parse one page of platform ``name`` in a pool worker.
+
+    Returns ``(deals, links, metrics)``: ``links`` is only filled in for
+    crawled pages and ``metrics`` is a :class:`PageMetrics` holding the
+    parse and extraction counters for the caller to merge.
+    """
+    platform = PLATFORMS[name]
+    metrics = PageMetrics(name, url)
+    if crawl:
+        deals, links = platform.crawl_page(content, url, None, metrics)
+    else:
+        deals, links = list(platform.iter_deals(content, None, metrics)), []
+    return deals, links, metrics
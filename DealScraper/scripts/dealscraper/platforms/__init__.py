@@ -0,0 +1,17 @@
+from . import amazon, flipkart, meesho, myntra
+from .base import Drop, Platform
+
+PLATFORMS = {
+    module.PLATFORM.name: module.PLATFORM
+    for module in (amazon, flipkart, myntra, meesho)
+}
+
+
+def get_platform(name):
+    try:
+        return PLATFORMS[name]
+    except KeyError:
+        raise ValueError(f"Unknown platform: {name}") from None
+
+
+__all__ = ['Drop', 'PLATFORMS', 'Platform', 'get_platform']
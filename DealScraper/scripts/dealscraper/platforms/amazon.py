@@ -0,0 +1,67 @@
+from ..categories import classify
+from ..selectors import Select
+from ..util import make_deal, original_from_discount, parse_percent, parse_price
+from .base import Drop, Platform
+
+
+class Amazon(Platform):
+    name = 'amazon'
+    label = 'Amazon'
+    base_url = 'https://www.amazon.in'
+    urls = [
+        'https://www.amazon.in/gp/goldbox',
+        'https://www.amazon.in/deals'
+    ]
+    max_deals = 15
+    crawl_links = {
+        'pagination': r'[?&]page=\d+',
+        'category': r'^/(s|b|deals)(/|\?|$)|^/gp/(goldbox|browse\.html)',
+    }
+    spec = {
+        'cards': Select(['div', 'span'], class_='DealCard|dealCard|deal', limit=10),
+        'title': [Select(['span', 'div', 'h2'], class_='title|DealTitle'), Select('a')],
+        'price': Select(['span', 'div'], class_='price|Price'),
+        'discount': Select(['span', 'div'], class_='discount|Discount|savingsPercentage'),
+        'image': Select('img'),
+        'link': Select('a', attr='href'),
+    }
+
+    def parse_card(self, element):
+        title = self.text('title', element)
+        if title is None:
+            raise Drop('no title')
+
+        title = title.strip()[:200]
+        if len(title) < 10:
+            raise Drop('title too short')
+
+        price_text = self.text('price', element)
+        discount_text = self.text('discount', element)
+
+        if price_text is None:
+            raise Drop('no price')
+
+        discounted_price = parse_price(price_text.strip())
+        if discounted_price is None:
+            raise Drop('unparseable price')
+
+        discount_percentage = 30
+        if discount_text is not None:
+            parsed = parse_percent(discount_text)
+            if parsed is not None:
+                discount_percentage = parsed
+
+        original_price = original_from_discount(discounted_price, discount_percentage)
+
+        img_elem = self.find('image', element)
+        image_url = img_elem.get('src', '') if img_elem is not None else ''
+
+        deal_url = self.deal_url(element)
+
+        category = classify(title, self.default_category)
+
+        return make_deal(self.name, title, category, original_price, discounted_price,
+                         discount_percentage, image_url, deal_url)
+
+
+PLATFORM = Amazon()
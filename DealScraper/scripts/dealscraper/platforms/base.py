@@ -0,0 +1,175 @@
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+
+from ..memo import MISSING
+from ..selectors import Select, compile_spec, first, outer_html, parse_html, text
+from ..util import absolute_url
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+ANCHORS = Select('a', attr='href')
+
+
+class Drop(Exception):
+    """Raised by ``parse_card`` to skip a card; the message is the reason."""
+
+
+class Platform:
+    """A site the engine knows how to scrape.
+
+    Subclasses list their seed ``urls``, declare an extraction ``spec`` of
+    :class:`~dealscraper.selectors.Select` fields (``cards`` picks the card
+    elements, the rest are looked up inside each card) and implement
+    ``parse_card``, which raises :class:`Drop` for cards that are not deals.
+    The spec is compiled into XPath once, when the platform is
+    instantiated; fetching, concurrency and error handling live in the
+    engine.
+
+    ``crawl_links`` maps the kinds of link crawl mode follows,
+    ``pagination`` and ``category``, to regular expressions searched in the
+    path and query of every same-site link on a page; the first kind that
+    matches wins.
+    """
+
+    name = None
+    label = None
+    base_url = None
+    urls = []
+    headers = BROWSER_HEADERS
+    timeout = 10
+    max_deals = 10
+    refresh_interval = 15 * 60
+    default_category = 'electronics'
+    spec = {}
+    crawl_links = {}
+
+    def __init__(self):
+        self.selectors = compile_spec(self.spec)
+        self.link_patterns = {kind: re.compile(pattern) for kind, pattern in self.crawl_links.items()}
+        self.host = urlsplit(self.base_url).hostname if self.base_url else None
+
+    def find(self, field, node):
+        return first(self.selectors[field], node)
+
+    def text(self, field, node):
+        element = self.find(field, node)
+        return text(element) if element is not None else None
+
+    def deal_url(self, card):
+        """The product URL of ``card``; raises :class:`Drop` when it has none.
+
+        The link is the card's ``link`` field, else the card itself when it
+        is an anchor, else the nearest anchor the card is wrapped in.
+        """
+        link = self.find('link', card)
+        if link is None and card.tag == 'a' and card.get('href'):
+            link = card
+        if link is None:
+            link = _wrapper(card)
+        url = absolute_url(link.get('href') if link is not None else None, self.base_url)
+        if url is None:
+            raise Drop('no link')
+        return url
+
+    def card_markup(self, card):
+        """The card's markup for the card memo, plus the href of an anchor wrapping it."""
+        markup = outer_html(card)
+        wrapper = _wrapper(card)
+        if wrapper is not None:
+            markup += wrapper.get('href').encode()
+        return markup
+
+    def find_cards(self, root, limit=True):
+        (select,) = self.selectors['cards']
+        return select.select_all(root, limit)
+
+    def find_links(self, root, url):
+        """Yield ``(kind, url)`` for every link on the page crawl mode should follow."""
+        for anchor in ANCHORS.select_all(root):
+            link = urljoin(url, anchor.get('href').strip())
+            parts = urlsplit(link)
+            if parts.scheme not in ('http', 'https') or parts.hostname != self.host:
+                continue
+            target = parts.path + ('?' + parts.query if parts.query else '')
+            for kind, pattern in self.link_patterns.items():
+                if pattern.search(target):
+                    yield kind, link
+                    break
+
+    def crawl_page(self, content, url, memo=None, metrics=None):
+        """Return every deal on a page, ignoring the card limit, and the links to follow from it."""
+        start = time.perf_counter()
+        root = parse_html(content)
+        if metrics is not None:
+            metrics.parse += time.perf_counter() - start
+        if root is None:
+            return [], []
+        deals = []
+        for card in self.find_cards(root, limit=False):
+            deal = self.deal_from_card(card, memo, metrics)
+            if deal:
+                deals.append(deal)
+        return deals, list(self.find_links(root, url))
+
+    def iter_deals(self, content, memo=None, metrics=None):
+        if memo is None:
+            yield from self._iter_deals(content, None, metrics)
+            return
+
+        # Extract the whole page up front so its memo entry is complete even
+        # if the caller stops early.
+        key, deals = memo.page(self, content)
+        if deals is MISSING:
+            deals = list(self._iter_deals(content, memo, metrics))
+            memo.put(key, deals)
+        elif metrics is not None:
+            metrics.memo = True
+            metrics.deals = len(deals)
+        yield from deals
+
+    def _iter_deals(self, content, memo=None, metrics=None):
+        start = time.perf_counter()
+        root = parse_html(content)
+        if metrics is not None:
+            metrics.parse += time.perf_counter() - start
+        if root is None:
+            return
+        for card in self.find_cards(root):
+            deal = self.deal_from_card(card, memo, metrics)
+            if deal:
+                yield deal
+
+    def deal_from_card(self, card, memo=None, metrics=None):
+        start = time.perf_counter()
+        if memo is not None:
+            deal, reason = memo.card(self, self.card_markup(card), lambda: self.check_card(card))
+        else:
+            deal, reason = self.check_card(card)
+        if metrics is not None:
+            metrics.card(reason, time.perf_counter() - start)
+        return deal
+
+    def check_card(self, card):
+        """Return ``(deal, None)`` or ``(None, reason)`` for one card."""
+        try:
+            deal = self.parse_card(card)
+        except Drop as e:
+            return None, str(e)
+        except Exception as e:
+            return None, f'error: {type(e).__name__}'
+        return (deal, None) if deal else (None, 'empty')
+
+    def extract(self, content):
+        return list(self.iter_deals(content))
+
+    def parse_card(self, card):
+        raise NotImplementedError
+
+
+def _wrapper(card):
+    return next((a for a in card.iterancestors('a') if a.get('href')), None)
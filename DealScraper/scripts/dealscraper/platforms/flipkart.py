@@ -0,0 +1,88 @@
+from ..categories import classify
+from ..selectors import Select
+from ..util import make_deal, original_from_discount, parse_percent, parse_price
+from .base import Drop, Platform
+
+
+class Flipkart(Platform):
+    name = 'flipkart'
+    label = 'Flipkart'
+    base_url = 'https://www.flipkart.com'
+    urls = [
+        'https://www.flipkart.com/',
+        'https://www.flipkart.com/offers-store'
+    ]
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0'
+    }
+    timeout = 20
+    max_deals = 15
+    crawl_links = {
+        'pagination': r'[?&]page=\d+',
+        'category': r'/(pr|clp)(/|\?|$)|^/offers-store',
+    }
+    spec = {
+        'cards': Select(['div', 'a'], class_='_1AtVbE|_2kHMtA|_13oc-S', limit=15),
+        'title': [Select(['div', 'a'], class_='_4rR01T|IRpwTa|s1Q9rs'), Select(['div', 'span', 'a'])],
+        'price': Select('div', class_='_30jeq3|_3I9_wc'),
+        'old_price': Select('div', class_='_3Djpdu|_3I9_wc'),
+        'discount': Select(['div', 'span'], class_='_3Ay6sb|_3xFhiH'),
+        'image': Select('img'),
+        'link': Select('a', attr='href'),
+    }
+
+    def parse_card(self, card):
+        title = self.text('title', card)
+        if title is None:
+            raise Drop('no title')
+
+        title = title.strip()[:200]
+        if len(title) < 10:
+            raise Drop('title too short')
+
+        price_text = self.text('price', card)
+        old_price_text = self.text('old_price', card)
+        discount_text = self.text('discount', card)
+
+        if price_text is None:
+            raise Drop('no price')
+
+        discounted_price = parse_price(price_text.strip())
+        if discounted_price is None:
+            raise Drop('unparseable price')
+
+        original_price = discounted_price
+        if old_price_text is not None:
+            old_price = parse_price(old_price_text.strip())
+            if old_price is not None:
+                original_price = old_price
+
+        discount_percentage = 25
+        if discount_text is not None:
+            parsed = parse_percent(discount_text)
+            if parsed is not None:
+                discount_percentage = parsed
+
+        if original_price == discounted_price:
+            original_price = original_from_discount(discounted_price, discount_percentage)
+
+        img_elem = self.find('image', card)
+        image_url = img_elem.get('src', '') if img_elem is not None else ''
+
+        deal_url = self.deal_url(card)
+
+        category = classify(title, self.default_category)
+
+        return make_deal(self.name, title, category, original_price, discounted_price,
+                         discount_percentage, image_url, deal_url)
+
+
+PLATFORM = Flipkart()
@@ -0,0 +1,62 @@
+from ..categories import classify
+from ..selectors import Select
+from ..util import make_deal, original_from_discount, parse_price
+from .base import Drop, Platform
+
+
+class Meesho(Platform):
+    name = 'meesho'
+    label = 'Meesho'
+    base_url = 'https://www.meesho.com'
+    urls = [
+        'https://www.meesho.com/',
+        'https://www.meesho.com/top-deals/pl/3oo'
+    ]
+    max_deals = 10
+    default_category = 'fashion'
+    crawl_links = {
+        'pagination': r'[?&]page=\d+',
+        'category': r'/pl/\w+',
+    }
+    spec = {
+        'cards': Select(['div', 'a'], class_='ProductCard|sc-|Card__', limit=10),
+        'title': [Select(['p', 'div', 'span'], class_='Text|ProductCard__ProductTitle'), Select(['p', 'div'])],
+        'price': [Select(['span', 'p'], class_='ProductCard__PriceText|Price'), Select(['span', 'h5'])],
+        'image': Select('img'),
+        'link': Select('a', attr='href'),
+    }
+
+    def parse_card(self, card):
+        title = self.text('title', card)
+        if title is None:
+            raise Drop('no title')
+
+        title = title.strip()[:200]
+        if len(title) < 10:
+            raise Drop('title too short')
+
+        price_text = self.text('price', card)
+        if price_text is None:
+            raise Drop('no price')
+
+        discounted_price = parse_price(price_text.strip())
+        if discounted_price is None:
+            raise Drop('unparseable price')
+
+        discount_percentage = 50
+        original_price = original_from_discount(discounted_price, discount_percentage)
+
+        img_elem = self.find('image', card)
+        image_url = img_elem.get('src', '') if img_elem is not None else ''
+        if not image_url:
+            image_url = img_elem.get('data-src', '') if img_elem is not None else ''
+
+        deal_url = self.deal_url(card)
+
+        category = classify(title, self.default_category)
+
+        return make_deal(self.name, title, category, original_price, discounted_price,
+                         discount_percentage, image_url, deal_url)
+
+
+PLATFORM = Meesho()
@@ -0,0 +1,84 @@
+from ..selectors import Select
+from ..util import make_deal, original_from_discount, parse_percent, parse_price
+from .base import Drop, Platform
+
+CURRENCY = ('Rs.', '₹')
+
+
+class Myntra(Platform):
+    name = 'myntra'
+    label = 'Myntra'
+    base_url = 'https://www.myntra.com'
+    urls = [
+        'https://www.myntra.com/shop/men',
+        'https://www.myntra.com/shop/women'
+    ]
+    max_deals = 10
+    default_category = 'fashion'
+    crawl_links = {
+        'pagination': r'[?&]p=\d+',
+        'category': r'^/(shop/)?[a-z]+(-[a-z]+)*(\?|$)',
+    }
+    spec = {
+        'cards': Select('li', class_='product-base', limit=10),
+        'brand': Select(['h3', 'h4'], class_='product-brand|product-product'),
+        'product': Select('h4', class_='product-product'),
+        'price': Select(['span', 'div'], class_='product-discountedPrice'),
+        'old_price': Select('span', class_='product-strike'),
+        'discount': Select('span', class_='product-discountPercentage'),
+        'image': Select('img'),
+        'link': Select('a', attr='href'),
+    }
+
+    def parse_card(self, item):
+        brand = self.text('brand', item)
+        product_name = self.text('product', item)
+
+        if brand is None:
+            raise Drop('no brand')
+
+        brand = brand.strip()
+        product_name = product_name.strip() if product_name is not None else ''
+        title = f"{brand} {product_name}".strip()[:200]
+
+        if len(title) < 5:
+            raise Drop('title too short')
+
+        price_text = self.text('price', item)
+        old_price_text = self.text('old_price', item)
+        discount_text = self.text('discount', item)
+
+        if price_text is None:
+            raise Drop('no price')
+
+        discounted_price = parse_price(price_text.strip(), CURRENCY)
+        if discounted_price is None:
+            raise Drop('unparseable price')
+
+        original_price = discounted_price
+        if old_price_text is not None:
+            old_price = parse_price(old_price_text.strip(), CURRENCY)
+            if old_price is not None:
+                original_price = old_price
+
+        discount_percentage = 40
+        if discount_text is not None:
+            parsed = parse_percent(discount_text)
+            if parsed is not None:
+                discount_percentage = parsed
+
+        if original_price == discounted_price and discount_percentage > 0:
+            original_price = original_from_discount(discounted_price, discount_percentage)
+
+        img_elem = self.find('image', item)
+        image_url = img_elem.get('src', '') if img_elem is not None else ''
+
+        deal_url = self.deal_url(item)
+
+        category = self.default_category
+
+        return make_deal(self.name, title, category, original_price, discounted_price,
+                         discount_percentage, image_url, deal_url)
+
+
+PLATFORM = Myntra()
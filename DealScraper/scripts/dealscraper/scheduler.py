@@ -0,0 +1,184 @@
+import asyncio
+import json
+import random
+import sys
+import time
+
+from .deal import dumps, loads
+from .delta import DeltaFilter
+from .engine import Engine
+from .metrics import Metrics
+from .output import NdjsonWriter
+from .platforms import PLATFORMS
+from .state import connect, state_path
+
+DEFAULT_JITTER = 0.1
+BATCH_SIZE = 25
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    platform TEXT PRIMARY KEY,
+    deals TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+'''
+
+
+class ResultStore:
+    """The last successful scrape of each platform, kept across restarts."""
+
+    def __init__(self, path=None):
+        self.db = connect(path or state_path('results.sqlite3'))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def get(self, name):
+        row = self.db.execute('SELECT deals, scraped_at FROM results WHERE platform = ?', (name,)).fetchone()
+        if row is None:
+            return None
+        return loads(row[0]), row[1]
+
+    def put(self, name, deals, scraped_at=None):
+        self.db.execute(
+            'INSERT OR REPLACE INTO results (platform, deals, scraped_at) VALUES (?, ?, ?)',
+            (name, dumps(deals), scraped_at or time.time()),
+        )
+
+
+class Scheduler:
+    """Scrapes every platform on its own cadence and publishes deals as NDJSON.
+
+    Each platform runs every ``refresh_interval`` seconds (overridable per
+    platform through ``intervals``), spread by up to ``jitter`` of the
+    interval so runs do not line up.  On start the last good result of each
+    platform is published as a ``snapshot`` record; every run then writes a
+    ``start`` record, ``batch`` (or, with ``columnar``, ``columns``) records
+    and an ``end`` record carrying the run's page metrics, all tagged with
+    the platform; an ``end`` record with ``ok`` false (and the ``errors``)
+    means the run found nothing or failed and the previous result still
+    stands.  A ``{"type": "refresh", "platforms": [...]}`` line on stdin
+    starts the named platforms' next run immediately, and end of input
+    stops the scheduler.  With a ``history`` (a
+    :class:`~dealscraper.history.PriceHistory`) every deal scraped is also
+    recorded there, including those the ``delta`` index holds back.
+    """
+
+    def __init__(self, engine, names=None, intervals=None, jitter=DEFAULT_JITTER, results=None,
+                 delta=None, batch_size=BATCH_SIZE, columnar=False, history=None, stdin=None, stdout=None):
+        self.engine = engine
+        self.platforms = [PLATFORMS[name] for name in names or PLATFORMS]
+        self.intervals = intervals or {}
+        self.jitter = jitter
+        self.results = results or ResultStore()
+        self.delta = delta
+        self.batch_size = batch_size
+        self.columnar = columnar
+        self.history = history
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self._wakeups = {platform.name: asyncio.Event() for platform in self.platforms}
+
+    def interval(self, platform):
+        interval = self.intervals.get(platform.name, platform.refresh_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def publish_snapshots(self):
+        for platform in self.platforms:
+            stored = self.results.get(platform.name)
+            if stored is not None:
+                deals, scraped_at = stored
+                NdjsonWriter(self.stdout, {'platform': platform.name}).write(
+                    {'type': 'snapshot', 'deals': deals, 'scrapedAt': scraped_at}
+                )
+
+    async def run_platform(self, platform, next_run):
+        writer = NdjsonWriter(self.stdout, {'platform': platform.name}, self.batch_size, self.columnar)
+        emit = DeltaFilter(self.delta, writer.deal) if self.delta else writer.deal
+        deals = []
+
+        def collect(deal):
+            deals.append(deal)
+            if self.history:
+                self.history.add(deal)
+            emit(deal)
+
+        writer.write({'type': 'start'})
+        metrics = Metrics()
+        trailer = {}
+        try:
+            await self.engine.stream_platform(platform, collect, metrics)
+        except Exception as e:
+            trailer['errors'] = [str(e) or type(e).__name__]
+        else:
+            errors = [page.error for page in metrics.pages if page.error]
+            if errors:
+                trailer['errors'] = errors
+        if deals:
+            self.results.put(platform.name, deals)
+        if self.history:
+            self.history.flush()
+        count = len(deals)
+        if self.delta:
+            self.delta.flush()
+            count = emit.emitted
+            trailer['delta'] = emit.stats()
+        writer.end(count, ok=bool(deals), nextRunAt=time.time() + next_run, metrics=metrics.as_dict(), **trailer)
+
+    async def loop(self, platform):
+        wakeup = self._wakeups[platform.name]
+        while True:
+            wakeup.clear()
+            next_run = self.interval(platform)
+            try:
+                await self.run_platform(platform, next_run)
+            except Exception as e:
+                # Such as a state database locked by a manual run: report the
+                # run as failed and try again on the next interval.
+                error = str(e) or type(e).__name__
+                sys.stderr.write(f"Error running {platform.label}: {error}\n")
+                NdjsonWriter(self.stdout, {'platform': platform.name}).end(
+                    0, ok=False, nextRunAt=time.time() + next_run, errors=[error]
+                )
+            try:
+                await asyncio.wait_for(wakeup.wait(), next_run)
+            except asyncio.TimeoutError:
+                pass
+
+    def command(self, line):
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict) or command.get('type') != 'refresh':
+                raise ValueError('expected {"type": "refresh"}')
+        except ValueError as e:
+            NdjsonWriter(self.stdout).write({'type': 'error', 'error': f"Bad command: {e}"})
+            return
+        for name in command.get('platforms') or self._wakeups:
+            if name in self._wakeups:
+                self._wakeups[name].set()
+
+    async def run(self):
+        self.publish_snapshots()
+        loops = [asyncio.ensure_future(self.loop(platform)) for platform in self.platforms]
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await loop.run_in_executor(None, self.stdin.readline)
+                if not line:
+                    break
+                if line.strip():
+                    self.command(line)
+        finally:
+            for task in loops:
+                task.cancel()
+            await asyncio.gather(*loops, return_exceptions=True)
+
+
+async def schedule(engine_options=None, **options):
+    results = ResultStore()
+    try:
+        async with Engine(**(engine_options or {})) as engine:
+            await Scheduler(engine, results=results, **options).run()
+    finally:
+        results.close()
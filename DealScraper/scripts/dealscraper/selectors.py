@@ -0,0 +1,121 @@
+import re
+
+from lxml import etree
+
+REGEX_NS = {'re': 'http://exslt.org/regular-expressions'}
+LITERAL_ALTERNATION = re.compile(r'^[\w-]+(\|[\w-]+)*$')
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+TEXT = etree.XPath('string()')
+
+_parsers = {}
+
+
+class Select:
+    """Declarative element selector, compiled once into an lxml XPath.
+
+    Mirrors the ``find``/``find_all`` calls the scrapers used to make:
+    ``tags`` restricts the element names, ``class_`` is a regular expression
+    searched in the class attribute and ``attr`` requires an attribute to be
+    present.  ``limit`` caps how many elements ``select_all`` returns unless
+    it is called with ``limit=False``.
+    """
+
+    def __init__(self, tags=None, class_=None, attr=None, limit=None):
+        self.tags = [tags] if isinstance(tags, str) else tags
+        self.class_ = class_
+        self.attr = attr
+        self.limit = limit
+        self._tag_set = frozenset(self.tags) if self.tags else None
+        self._class_re = re.compile(class_) if class_ else None
+        self.first = etree.XPath(f"({self.expression()})[1]", namespaces=REGEX_NS)
+        self.all = etree.XPath(self.expression(limit), namespaces=REGEX_NS)
+        self.every = etree.XPath(self.expression(), namespaces=REGEX_NS) if limit else self.all
+
+    def expression(self, limit=None):
+        if not self.tags:
+            step = './/*'
+        elif len(self.tags) == 1:
+            step = f'.//{self.tags[0]}'
+        else:
+            step = './/*[' + ' or '.join(f'self::{tag}' for tag in self.tags) + ']'
+
+        if self.class_:
+            step += f'[{class_test(self.class_)}]'
+        if self.attr:
+            step += f'[@{self.attr}]'
+        if limit:
+            step = f'({step})[position() <= {limit}]'
+        return step
+
+    def select_first(self, node):
+        found = self.first(node)
+        return found[0] if found else None
+
+    def select_all(self, node, limit=True):
+        return self.all(node) if limit else self.every(node)
+
+    def matches(self, element):
+        """Test ``element`` itself, for parsers that see elements one at a time."""
+        if self._tag_set is not None and element.tag not in self._tag_set:
+            return False
+        if self._class_re is not None and not self._class_re.search(element.get('class') or ''):
+            return False
+        return self.attr is None or element.get(self.attr) is not None
+
+
+def class_test(pattern):
+    # Plain alternations such as 'DealCard|dealCard' stay inside libxml2 as
+    # contains() tests; anything else goes through the EXSLT regex extension.
+    if LITERAL_ALTERNATION.match(pattern):
+        return ' or '.join(f"contains(@class, '{literal}')" for literal in pattern.split('|'))
+    return f"re:test(@class, '{pattern}')"
+
+
+def compile_spec(spec):
+    """Turn ``{field: Select | [Select, ...]}`` into ``{field: (Select, ...)}``."""
+    return {
+        field: tuple(select) if isinstance(select, (list, tuple)) else (select,)
+        for field, select in spec.items()
+    }
+
+
+def first(selectors, node):
+    for select in selectors:
+        found = select.select_first(node)
+        if found is not None:
+            return found
+    return None
+
+
+def text(element):
+    return str(TEXT(element))
+
+
+def outer_html(element):
+    return etree.tostring(element, with_tail=False)
+
+
+def _parser(encoding):
+    parser = _parsers.get(encoding)
+    if parser is None:
+        parser = _parsers[encoding] = etree.HTMLParser(encoding=encoding)
+    return parser
+
+
+def sniff_encoding(content):
+    match = META_CHARSET.search(content[:2048])
+    if match:
+        encoding = match.group(1).decode('ascii').lower()
+        try:
+            ''.encode(encoding)
+            return encoding
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def parse_html(content):
+    if isinstance(content, str):
+        return etree.fromstring(content, _parser(None))
+    return etree.fromstring(content, _parser(sniff_encoding(content)))
@@ -0,0 +1,29 @@
+import os
+import sqlite3
+
+DEFAULT_STATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    '.cache', 'dealscraper',
+)
+
+
+def state_dir():
+    """Directory for the scrapers' persistent files, created on first use.
+
+    Defaults to ``DealScraper/.cache/dealscraper``; set ``DEALSCRAPER_STATE_DIR``
+    to move it.
+    """
+    path = os.environ.get('DEALSCRAPER_STATE_DIR') or DEFAULT_STATE_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def state_path(name):
+    return os.path.join(state_dir(), name)
+
+
+def connect(path):
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return connection
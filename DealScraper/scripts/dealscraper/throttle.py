@@ -0,0 +1,231 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from .state import connect, state_path
+
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+DEFAULT_RETRIES = 3
+DEFAULT_THRESHOLD = 5
+DEFAULT_COOLDOWN = 300
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS breakers (
+    host TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL,
+    opened_at REAL
+);
+'''
+
+
+class CircuitOpen(Exception):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+
+class RetriesExhausted(Exception):
+    """Raised when a request still fails after its last retry."""
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Exponential backoff with full jitter for retry number ``attempt`` (from 0)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a ``Retry-After`` header (delay or HTTP date), or ``None``."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Allows ``rate`` requests per second on average and bursts of up to ``burst``.
+
+    The rate adapts: every throttled response halves it (down to a tenth of
+    the configured rate) and every success wins a twentieth of the
+    configured rate back.  :meth:`pause` holds all requests until a
+    ``Retry-After`` has passed.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def throttled(self):
+        self.rate = max(self.max_rate / 10, self.rate / 2)
+
+    def succeeded(self):
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of one host.
+
+    After ``threshold`` failures in a row the breaker opens and requests
+    fail fast for ``cooldown`` seconds.  It then lets a single trial request
+    through: success closes it, failure opens it again.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, cooldown=DEFAULT_COOLDOWN, failures=0, opened_at=None):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = failures
+        self.opened_at = opened_at
+        self.trial = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.time() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half-open'
+
+    def allow(self, host):
+        """Raise :class:`CircuitOpen` unless a request may go out; ``True`` if it is the trial."""
+        state = self.state
+        if state == 'open':
+            remaining = self.cooldown - (time.time() - self.opened_at)
+            raise CircuitOpen(f"{host} circuit open for another {remaining:.0f}s")
+        if state == 'half-open':
+            if self.trial:
+                raise CircuitOpen(f"{host} circuit half-open, trial request in flight")
+            self.trial = True
+            return True
+        return False
+
+    def success(self):
+        changed = self.failures or self.opened_at is not None
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        return changed
+
+    def failure(self):
+        self.failures += 1
+        if self.trial or self.failures >= self.threshold:
+            self.opened_at = time.time()
+        self.trial = False
+        return True
+
+
+class Throttle:
+    """Per-host token buckets, retry backoff and circuit breakers shared by one engine.
+
+    Breaker state is kept in SQLite so a host that kept failing stays cut
+    off across runs until its cooldown has passed.
+    """
+
+    def __init__(self, path=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST, retries=DEFAULT_RETRIES,
+                 threshold=DEFAULT_THRESHOLD, cooldown=DEFAULT_COOLDOWN):
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.db = connect(path or state_path('throttle.sqlite3'))
+        self.db.executescript(SCHEMA)
+        self._buckets = {}
+        self._breakers = {}
+
+    def close(self):
+        self.db.close()
+
+    def bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def breaker(self, host):
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            row = self.db.execute('SELECT failures, opened_at FROM breakers WHERE host = ?', (host,)).fetchone()
+            breaker = self._breakers[host] = CircuitBreaker(self.threshold, self.cooldown, *(row or ()))
+        return breaker
+
+    def _save(self, host, breaker):
+        self.db.execute('INSERT OR REPLACE INTO breakers (host, failures, opened_at) VALUES (?, ?, ?)',
+                        (host, breaker.failures, breaker.opened_at))
+
+    async def acquire(self, host):
+        """Wait for a request slot on ``host``; raises :class:`CircuitOpen` if it is cut off.
+
+        Returns ``True`` when the request is a half-open breaker's trial,
+        which must end in :meth:`succeeded`, :meth:`rejected`,
+        :meth:`failed` or :meth:`end_trial`.
+        """
+        breaker = self.breaker(host)
+        trial = breaker.allow(host)
+        try:
+            await self.bucket(host).acquire()
+        except BaseException:
+            if trial:
+                breaker.trial = False
+            raise
+        return trial
+
+    def end_trial(self, host):
+        """Give up a trial request that ended without a response, so another can be made."""
+        self.breaker(host).trial = False
+
+    def succeeded(self, host):
+        self.bucket(host).succeeded()
+        breaker = self.breaker(host)
+        if breaker.success():
+            self._save(host, breaker)
+
+    def rejected(self, host):
+        """Record an error response that is not worth retrying, such as a 403."""
+        breaker = self.breaker(host)
+        breaker.failure()
+        self._save(host, breaker)
+
+    def failed(self, host, attempt, throttled=False, retry_after=None):
+        """Record a failed attempt and return the delay before retrying, or ``None`` to give up."""
+        bucket = self.bucket(host)
+        if throttled:
+            bucket.throttled()
+        breaker = self.breaker(host)
+        breaker.failure()
+        self._save(host, breaker)
+        if attempt >= self.retries or breaker.state != 'closed':
+            return None
+        delay = backoff_delay(attempt)
+        wait = parse_retry_after(retry_after)
+        if wait is not None:
+            bucket.pause(wait)
+            delay = max(delay, wait)
+        return delay
@@ -0,0 +1,61 @@
+import re
+from urllib.parse import urljoin, urlsplit
+
+from .deal import Deal
+
+PRICE_RE = re.compile(r'[\d,]+')
+PERCENT_RE = re.compile(r'(\d+)')
+
+
+def parse_price(text, currency=('₹',)):
+    for symbol in currency:
+        text = text.replace(symbol, '')
+    match = PRICE_RE.search(text)
+    if not match:
+        return None
+    digits = match.group().replace(',', '')
+    if not digits:
+        return None
+    return int(digits)
+
+
+def parse_percent(text):
+    match = PERCENT_RE.search(text)
+    if not match:
+        return None
+    return int(match.group())
+
+
+def original_from_discount(discounted_price, discount_percentage):
+    return int(discounted_price / (1 - discount_percentage / 100))
+
+
+def absolute_url(href, base):
+    """Resolve a card's ``href`` against the site root ``base``.
+
+    Returns ``None`` for anything that does not point at a page of its own
+    (a missing or fragment href, ``javascript:`` links, the site root), so
+    callers never pass a shared URL off as a product's.
+    """
+    href = (href or '').strip()
+    if not href or href.startswith('#'):
+        return None
+    url = urljoin(base + '/', href)
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.path.strip('/'):
+        return None
+    return url
+
+
+def make_deal(platform, title, category, original_price, discounted_price,
+              discount_percentage, image_url, deal_url):
+    return Deal(
+        title=title,
+        platform=platform,
+        category=category,
+        original_price=original_price * 100,
+        discounted_price=discounted_price * 100,
+        discount_percentage=discount_percentage,
+        image_url=image_url if image_url.startswith('http') else None,
+        deal_url=deal_url,
+    )
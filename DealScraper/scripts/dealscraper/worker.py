@@ -0,0 +1,127 @@
+import asyncio
+import json
+import sys
+
+from .delta import DeltaFilter
+from .engine import Engine
+from .metrics import Metrics
+from .output import NdjsonWriter
+from .platforms import PLATFORMS
+
+
+class Worker:
+    """Serves scrape requests as line-delimited JSON over stdin/stdout.
+
+    Each request is one line such as ``{"id": 1, "platforms": ["amazon"]}``
+    and is answered with ``{"id": 1, "deals": [...]}`` or
+    ``{"id": 1, "type": "error", "error": "..."}``.  With ``"stream": true``
+    the answer is instead a ``deal`` record per card (or ``batch`` records
+    of up to ``"batch": n`` deals, as ``columns`` records with
+    ``"columnar": true``) followed by an ``end`` record, each tagged
+    with the request id; when the engine memoizes extraction the ``end``
+    record also carries the ``memo`` stats gathered while the request ran,
+    and ``"metrics": true`` adds per-page timings and card counts to the
+    answer.  Requests run concurrently on one engine, so imports, compiled
+    selectors and pooled connections stay warm for the lifetime of the
+    process.
+
+    With a ``delta`` index, requests with ``"delta": true`` only get deals
+    that are new or changed since they were last sent; other requests get
+    every deal and reseed the index.  With a ``history`` (a
+    :class:`~dealscraper.history.PriceHistory`) every deal scraped for any
+    request is recorded there, including those the delta index holds back.
+    """
+
+    def __init__(self, engine, stdin=None, stdout=None, delta=None, history=None):
+        self.engine = engine
+        self.delta = delta
+        self.history = history
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self._tasks = set()
+
+    def writer(self, request_id):
+        return NdjsonWriter(self.stdout, {'id': request_id})
+
+    async def handle(self, request):
+        writer = self.writer(request.get('id'))
+        try:
+            writer.batch_size = int(request.get('batch') or 1)
+            writer.columnar = bool(request.get('columnar'))
+            names = request.get('platforms') or list(PLATFORMS)
+            unknown = [name for name in names if name not in PLATFORMS]
+            if unknown:
+                raise ValueError(f"Unknown platform: {', '.join(unknown)}")
+            metrics = Metrics() if request.get('metrics') else None
+            trailer = {}
+            if request.get('stream'):
+                memo = self.engine.memo
+                before = memo.stats.copy() if memo else None
+                emit = self.delta_filter(request, writer.deal)
+                count = await self.engine.stream(names, self.recorder(emit), metrics)
+                if memo:
+                    trailer['memo'] = memo.stats.since(before).as_dict()
+                if metrics:
+                    trailer['metrics'] = metrics.as_dict()
+                if isinstance(emit, DeltaFilter):
+                    count = emit.emitted
+                    trailer['delta'] = emit.stats()
+                writer.end(count, **trailer)
+            else:
+                results = await self.engine.scrape(names, metrics)
+                deals = []
+                emit = self.delta_filter(request, deals.append)
+                record = self.recorder(emit)
+                for platform_deals in results.values():
+                    for deal in platform_deals:
+                        record(deal)
+                if metrics:
+                    trailer['metrics'] = metrics.as_dict()
+                if isinstance(emit, DeltaFilter):
+                    trailer['delta'] = emit.stats()
+                writer.write({'deals': deals, **trailer})
+        except Exception as e:
+            writer.flush_batch()
+            writer.write({'type': 'error', 'error': str(e) or type(e).__name__})
+        finally:
+            if self.delta is not None:
+                self.delta.flush()
+            if self.history is not None:
+                self.history.flush()
+
+    def delta_filter(self, request, emit):
+        if self.delta is None:
+            return emit
+        return DeltaFilter(self.delta, emit, skip_unchanged=bool(request.get('delta')))
+
+    def recorder(self, emit):
+        return self.history.recorder(emit) if self.history is not None else emit
+
+    def dispatch(self, line):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('request must be a JSON object')
+        except ValueError as e:
+            self.writer(None).write({'type': 'error', 'error': f"Bad request: {e}"})
+            return
+        task = asyncio.ensure_future(self.handle(request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await loop.run_in_executor(None, self.stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if line:
+                self.dispatch(line)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def serve(engine_options=None, delta=None, history=None):
+    async with Engine(**(engine_options or {})) as engine:
+        await Worker(engine, delta=delta, history=history).run()
@@ -0,0 +1,18 @@
+from dealscraper.categories import Classifier, classify, classify_many
+
+TITLES = ['Running Shoes for Men', 'Kitchen Knife Set', 'Yoga Book', 'Phone Case', 'Plain Mug', '']
+
+
+def test_classify_many_matches_classify():
+    assert classify_many(TITLES, 'other') == [classify(title, 'other') for title in TITLES]
+
+
+def test_classify_many_empty_batch():
+    assert classify_many([], 'other') == []
+    assert classify_many(iter(()), 'other') == []
+
+
+def test_earlier_category_wins():
+    classifier = Classifier({'a': ['book'], 'b': ['bookshelf', 'shelf']})
+    assert classifier.classify('Wooden Bookshelf', 'x') == 'a'
+    assert classifier.classify_many(['Wooden Bookshelf', 'Shelf'], 'x') == ['a', 'b']
@@ -0,0 +1,36 @@
+from dealscraper.delta import DeltaIndex, fingerprint, normalize_url
+from dealscraper.util import make_deal
+
+
+def deal(price=500, url='https://www.amazon.in/dp/B01?tag=aff', title='Steel  Water Bottle'):
+    return make_deal('amazon', title, 'home', 1000, price, 50, '', url)
+
+
+def test_normalize_url_drops_tracking_fragments_and_case():
+    assert normalize_url('HTTPS://www.Amazon.in/dp/B0/ref=sr_1_1?utm_source=x&b=2&a=1&tag=aff#top') \
+        == 'https://www.amazon.in/dp/B0?a=1&b=2'
+    assert normalize_url('https://www.flipkart.com/p/item/?pid=1') == 'https://www.flipkart.com/p/item?pid=1'
+
+
+def test_fingerprint_ignores_tracking_and_title_spacing():
+    assert fingerprint(deal()) == fingerprint(deal(url='https://www.amazon.in/dp/B01', title='steel water bottle'))
+    assert fingerprint(deal()) != fingerprint(deal(url='https://www.amazon.in/dp/B02'))
+
+
+def test_check_classifies_new_unchanged_changed_and_stale(tmp_path):
+    path = str(tmp_path / 'delta.sqlite3')
+    index = DeltaIndex(path, max_age=3600)
+    assert index.check(deal()) == 'new'
+    assert index.check(deal()) is None
+    index.flush()
+    assert index.check(deal()) is None
+    assert index.check(deal(price=450)) == 'changed'
+    index.close()
+
+    index = DeltaIndex(path, max_age=3600)
+    assert index.check(deal(price=450)) is None
+    index.close()
+
+    index = DeltaIndex(path, max_age=-1)
+    assert index.check(deal(price=450)) == 'stale'
+    index.close()
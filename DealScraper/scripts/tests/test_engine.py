@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from dealscraper.engine import Engine
+from dealscraper.metrics import Metrics
+from dealscraper.platforms import PLATFORMS, get_platform
+from dealscraper.throttle import Throttle
+from pages import site_pages
+from server import StandInServer
+
+MEESHO_PATHS = ['/www.meesho.com/', '/www.meesho.com/top-deals/pl/3oo']
+
+
+@pytest.fixture(scope='module')
+def pages():
+    return site_pages(PLATFORMS.values())
+
+
+def scrape(names, **options):
+    async def run():
+        metrics = Metrics()
+        async with Engine(**options) as engine:
+            return await engine.scrape(names, metrics), metrics
+    return asyncio.run(run())
+
+
+def test_scrape_fills_every_platforms_quota(pages):
+    with StandInServer(pages) as server:
+        results, metrics = scrape(None, origin=server.origin)
+        assert server.requests == sum(len(platform.urls) for platform in PLATFORMS.values())
+    assert list(results) == list(PLATFORMS)
+    for name, deals in results.items():
+        platform = get_platform(name)
+        assert len(deals) == platform.max_deals
+        assert all(deal.platform == name and deal.deal_url.startswith(platform.base_url) for deal in deals)
+    assert all(page.status == 200 and page.error is None for page in metrics.pages)
+
+
+def test_stream_emits_as_deals_are_parsed(pages):
+    emitted = []
+
+    async def run():
+        async with Engine(origin=server.origin) as engine:
+            return await engine.stream(['amazon', 'myntra'], emitted.append)
+
+    with StandInServer(pages) as server:
+        count = asyncio.run(run())
+    assert count == len(emitted) == PLATFORMS['amazon'].max_deals + PLATFORMS['myntra'].max_deals
+    assert {deal.platform for deal in emitted} == {'amazon', 'myntra'}
+
+
+def test_failed_pages_are_skipped(pages):
+    with StandInServer(pages, statuses={MEESHO_PATHS[0]: 404}) as server:
+        results, metrics = scrape(['meesho'], origin=server.origin)
+    assert results['meesho']
+    assert sorted(page.status for page in metrics.pages) == [200, 404]
+
+    with StandInServer() as server:
+        origin = server.origin
+    results, metrics = scrape(['meesho'], origin=origin)
+    assert results == {'meesho': []}
+    assert all(page.error for page in metrics.pages)
+
+
+def test_rejections_open_the_breaker_without_retrying(pages, tmp_path):
+    path = str(tmp_path / 'throttle.sqlite3')
+    with StandInServer(pages, statuses={path: 403 for path in MEESHO_PATHS}) as server:
+        results, _ = scrape(['meesho'], origin=server.origin, throttle=Throttle(path, threshold=2))
+        assert server.requests == 2
+        results, metrics = scrape(['meesho'], origin=server.origin, throttle=Throttle(path, threshold=2))
+        assert server.requests == 2
+    assert results == {'meesho': []}
+    assert all('circuit open' in page.error for page in metrics.pages)
+
+
+def test_server_errors_are_retried(pages, tmp_path):
+    throttle = Throttle(str(tmp_path / 'throttle.sqlite3'), retries=1, threshold=10)
+    with StandInServer(pages, statuses={MEESHO_PATHS[0]: 503}) as server:
+        results, metrics = scrape(['meesho'], origin=server.origin, throttle=throttle)
+        assert server.requests == 3
+    errors = [page.error for page in metrics.pages if page.error]
+    assert errors == ['www.meesho.com: HTTP 503 after 2 attempts']
+    assert results['meesho']
+
+
+def test_trial_that_raises_is_released(pages, tmp_path, monkeypatch):
+    throttle = Throttle(str(tmp_path / 'throttle.sqlite3'), threshold=1, cooldown=60)
+    breaker = throttle.breaker('www.meesho.com')
+    breaker.failure()
+    breaker.opened_at -= 61
+
+    async def run():
+        async with Engine(throttle=throttle) as engine:
+            def broken(*args, **kwargs):
+                raise RuntimeError('boom')
+            monkeypatch.setattr(engine.session, 'get', broken)
+            return await engine.scrape_platform('meesho')
+
+    assert asyncio.run(run()) == []
+    assert breaker.state == 'half-open' and not breaker.trial
@@ -0,0 +1,91 @@
+import types
+
+import pytest
+
+from dealscraper import history
+from dealscraper.history import DAY, PriceHistory
+from dealscraper.util import make_deal
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=NOW)
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(history, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    store = PriceHistory(str(tmp_path / 'history.sqlite3'))
+    yield store
+    store.close()
+
+
+def deal(price, original=2000, sku='1'):
+    return make_deal('amazon', f'Product {sku}', 'electronics', original, price,
+                     round((original - price) / original * 100),
+                     f'https://img.example.com/{sku}.jpg', f'https://www.amazon.in/dp/{sku}?ref=deal')
+
+
+def prices(rows):
+    return [discounted // 100 for _, discounted, _ in rows]
+
+
+def observe(store, seen, sku='1'):
+    for days_ago, price in seen:
+        store.add(deal(price, sku=sku), NOW - days_ago * DAY)
+    store.flush()
+
+
+def test_windows_cut_off_at_the_given_age(store):
+    observe(store, [(31, 500), (30, 900), (10, 1100), (0, 1000)])
+    assert prices(store.history(deal(1000))) == [500, 900, 1100, 1000]
+    assert prices(store.history(deal(1000), 30)) == [900, 1100, 1000]
+    assert store.lowest(deal(1000), 30) == 90000
+    assert store.lowest(deal(1000), 31) == 50000
+    assert store.lowest(deal(1000, sku='2')) is None
+
+
+def test_median_and_real_discount(store):
+    observe(store, [(3, 1200), (2, 1000), (1, 1400), (0, 800)])
+    assert store.median(deal(800)) == 110000
+    assert store.stats(deal(800)) == {
+        'observations': 4, 'price': 80000, 'lowestPrice': 80000, 'medianPrice': 110000,
+        'realDiscount': 27, 'claimedDiscount': 60,
+    }
+    # A listed original price far above what the deal usually sells for
+    # shows up as a claimed discount well above the real one.
+    stats = store.real_discount(deal(880, original=4400))
+    assert stats['realDiscount'] == 20 and stats['claimedDiscount'] == 80
+    assert store.real_discount(deal(880, sku='2')) is None
+
+
+def test_deals_are_found_by_normalized_url(store):
+    observe(store, [(5, 1000), (1, 900)])
+    [product] = store.find('https://www.amazon.in/dp/1')
+    assert product['firstSeen'] == NOW - 5 * DAY and product['lastSeen'] == NOW - DAY
+
+
+def test_prune_drops_stale_deals_with_their_observations(store):
+    observe(store, [(100, 1000), (50, 900)], sku='old')
+    observe(store, [(100, 1000), (1, 900)], sku='new')
+    store.prune(NOW - 30 * DAY)
+    assert store.find(deal(0, sku='old').deal_url) == []
+    assert store.history(deal(0, sku='old')) == []
+    assert prices(store.history(deal(0, sku='new'))) == [1000, 900]
+    assert store.db.execute('SELECT COUNT(*) FROM observations').fetchone()[0] == 2
+
+
+def test_opening_the_store_applies_the_retention(tmp_path, clock):
+    path = str(tmp_path / 'history.sqlite3')
+    store = PriceHistory(path)
+    observe(store, [(400, 1000)], sku='old')
+    observe(store, [(10, 1000)], sku='new')
+    store.close()
+    store = PriceHistory(path)
+    assert store.history(deal(0, sku='old')) == []
+    assert len(store.history(deal(0, sku='new'))) == 1
+    store.close()
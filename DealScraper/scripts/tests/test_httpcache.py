@@ -0,0 +1,99 @@
+import asyncio
+import types
+
+import pytest
+
+from dealscraper import httpcache
+from dealscraper.engine import Engine
+from dealscraper.httpcache import HttpCache
+from dealscraper.metrics import Metrics
+from dealscraper.platforms import PLATFORMS
+from dealscraper.util import make_deal
+from pages import site_pages
+from server import StandInServer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1_000_000.0)
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(httpcache, 'time', clock)
+    return clock
+
+
+def deal(i):
+    return make_deal('amazon', f'Product {i}', 'electronics', 2000, 1000, 50,
+                     f'https://img.example.com/{i}.jpg', f'https://www.amazon.in/dp/{i}')
+
+
+def test_entries_go_stale_after_the_ttl(tmp_path, clock):
+    cache = HttpCache(str(tmp_path / 'cache.sqlite3'), ttl=300)
+    cache.store('https://a/', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}, [deal(1)])
+    entry = cache.get('https://a/')
+    assert entry.fresh and repr(entry.deals) == repr([deal(1)])
+    assert entry.validators() == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    clock.now += 300
+    assert not cache.get('https://a/').fresh
+    cache.revalidated('https://a/')
+    assert cache.get('https://a/').fresh
+    assert cache.get('https://b/') is None
+
+
+def test_no_store_responses_are_not_cached(tmp_path, clock):
+    cache = HttpCache(str(tmp_path / 'cache.sqlite3'))
+    cache.store('https://a/', {'Cache-Control': 'private, no-store'}, [deal(1)])
+    assert cache.get('https://a/') is None
+
+
+def test_least_recently_used_pages_are_evicted(tmp_path, clock):
+    size = len(httpcache.dumps([deal(0)]))
+    cache = HttpCache(str(tmp_path / 'cache.sqlite3'), max_bytes=2 * size)
+    for i in range(2):
+        clock.now += 1
+        cache.store(f'https://{i}/', {}, [deal(i)])
+    clock.now += 1
+    cache.get('https://0/')
+    clock.now += 1
+    cache.store('https://2/', {}, [deal(2)])
+    assert [cache.get(f'https://{i}/') is not None for i in range(3)] == [True, False, True]
+
+
+def scrape(server, cache, origin=None):
+    async def run():
+        metrics = Metrics()
+        async with Engine(origin=origin or server.origin, cache=cache) as engine:
+            results = await engine.scrape(['flipkart'], metrics)
+        return results['flipkart'], [page.source for page in metrics.pages]
+    return asyncio.run(run())
+
+
+def test_engine_replays_and_revalidates(tmp_path):
+    pages = len(PLATFORMS['flipkart'].urls)
+    path = str(tmp_path / 'cache.sqlite3')
+    with StandInServer(site_pages(PLATFORMS.values())) as server:
+        fetched, sources = scrape(server, HttpCache(path))
+        assert sources == ['network'] * pages and server.requests == pages
+
+        replayed, sources = scrape(server, HttpCache(path))
+        assert sources == ['cache'] * pages and server.requests == pages
+
+        sent = server.bytes_sent
+        revalidated, sources = scrape(server, HttpCache(path, ttl=0))
+        assert sources == ['revalidated'] * pages and server.requests == 2 * pages
+        assert server.bytes_sent == sent
+
+        # The pages race for the platform's quota, so each run may keep a
+        # different share of each page, but all of it comes from the cache.
+        cache, engine = HttpCache(path), Engine(origin=server.origin)
+        stored = {repr(deal) for url in PLATFORMS['flipkart'].urls for deal in cache.get(engine.resolve(url)).deals}
+        assert len(fetched) == len(replayed) == len(revalidated)
+        assert {repr(deal) for deal in fetched + replayed + revalidated} <= stored
+
+
+def test_engine_keys_entries_by_the_fetched_url(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    with StandInServer(site_pages(PLATFORMS.values())) as first, StandInServer() as second:
+        deals, _ = scrape(first, HttpCache(path))
+        assert deals
+        deals, sources = scrape(second, HttpCache(path))
+        assert set(sources) == {'network'} and deals == []
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from dealscraper.engine import Engine
+from dealscraper.incremental import CardStream
+from dealscraper.metrics import Metrics
+from dealscraper.platforms import PLATFORMS, get_platform
+from pages import build_page, site_pages
+from server import StandInServer
+
+
+def stream_deals(platform, content, chunk_size=512):
+    cards = CardStream(platform)
+    deals = []
+    for start in range(0, len(content), chunk_size):
+        deals.extend(cards.feed(content[start:start + chunk_size]))
+        if cards.exhausted:
+            return deals
+    deals.extend(cards.close())
+    return deals
+
+
+def nested_cards(count):
+    # The card class test 'deal' also matches the price and badge divs
+    # inside every DealCard, and those close before the card around them.
+    return ''.join(
+        f'<div class="DealCard"><a href="/dp/B{i:05d}"><img src="https://m.media-amazon.com/{i}.jpg"></a>'
+        f'<div class="DealTitle">Stainless Steel Bottle {i}</div>'
+        f'<div class="dealPrice"><span class="a-price">₹{100 + i}</span></div>'
+        f'<div class="dealBadge"><span class="savingsPercentage">{10 + i}% off</span></div></div>'
+        for i in range(count)
+    )
+
+
+@pytest.mark.parametrize('chunk_size', [64, 512, 1 << 20])
+def test_nested_cards_match_full_parse(chunk_size):
+    platform = get_platform('amazon')
+    content = f'<html><body><main>{nested_cards(8)}</main></body></html>'.encode()
+    expected = platform.extract(content)
+    assert expected
+    assert stream_deals(platform, content, chunk_size) == expected
+
+
+@pytest.mark.parametrize('name', list(PLATFORMS))
+def test_stand_in_pages_match_full_parse(name):
+    platform = get_platform(name)
+    content = build_page(name, platform.urls[0])
+    assert stream_deals(platform, content) == platform.extract(content)
+
+
+def test_engine_stops_reading_once_the_cards_are_in():
+    async def page(origin, incremental):
+        platform = get_platform('flipkart')
+        metrics = Metrics().page(platform, platform.urls[0])
+        async with Engine(origin=origin, incremental=incremental) as engine:
+            deals = [deal async for deal in engine.page_deals(platform, platform.urls[0], metrics)]
+        return deals, metrics.bytes
+
+    with StandInServer(site_pages(PLATFORMS.values())) as server:
+        full, full_bytes = asyncio.run(page(server.origin, False))
+        streamed, streamed_bytes = asyncio.run(page(server.origin, True))
+    assert streamed == full
+    assert streamed_bytes < full_bytes
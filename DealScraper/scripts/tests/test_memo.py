@@ -0,0 +1,103 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+from dealscraper import memo as memo_module
+from dealscraper.engine import Engine
+from dealscraper.memo import MISSING, MemoStore
+from dealscraper.platforms import PLATFORMS, get_platform
+from pages import build_page, site_pages
+from server import StandInServer
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'memo.sqlite3')
+
+
+def extract(platform, content, memo):
+    deals = list(platform.iter_deals(content, memo))
+    memo.flush()
+    return deals
+
+
+def test_pages_replay_their_deals(path):
+    platform = get_platform('amazon')
+    content = build_page('amazon', platform.urls[0])
+    memo = MemoStore(path)
+    assert extract(platform, content, memo) == platform.extract(content)
+    memo.close()
+
+    memo = MemoStore(path)
+    assert extract(platform, content, memo) == platform.extract(content)
+    assert (memo.stats.page_hits, memo.stats.card_hits + memo.stats.card_misses) == (1, 0)
+
+
+def test_unchanged_cards_replay_on_a_changed_page(path):
+    platform = get_platform('myntra')
+    content = build_page('myntra', platform.urls[0])
+    memo = MemoStore(path)
+    extract(platform, content, memo)
+    checked = memo.stats.card_misses
+    assert checked > 0
+
+    changed = content.replace(b'</body>', b'<!-- refreshed --></body>')
+    assert extract(platform, changed, memo) == platform.extract(content)
+    assert memo.stats.page_misses == 2
+    assert (memo.stats.card_hits, memo.stats.card_misses) == (checked, checked)
+
+
+def test_dropped_cards_are_remembered_with_their_reason(path):
+    platform = get_platform('amazon')
+    memo = MemoStore(path)
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return None, 'no price'
+
+    assert memo.card(platform, b'<div/>', parse) == (None, 'no price')
+    memo.flush()
+    assert tuple(MemoStore(path).card(platform, b'<div/>', parse)) == (None, 'no price')
+    assert len(calls) == 1
+
+
+def test_keys_are_salted_per_platform(path):
+    memo = MemoStore(path)
+    amazon, flipkart = get_platform('amazon'), get_platform('flipkart')
+    assert memo.key(amazon, 'card', b'x') != memo.key(flipkart, 'card', b'x')
+    assert memo.key(amazon, 'card', b'x') != memo.key(amazon, 'page', b'x')
+    assert memo.key(amazon, 'card', b'x') == MemoStore(path).key(amazon, 'card', b'x')
+
+
+def test_least_recently_used_entries_are_evicted(path, monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0, perf_counter=time.perf_counter)
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(memo_module, 'time', clock)
+    memo = MemoStore(path, max_entries=2)
+    for key in (b'a', b'b'):
+        clock.now += 1
+        memo.put(key, [])
+        memo.flush()
+    clock.now += 1
+    memo.get(b'a')
+    memo.flush()
+    clock.now += 1
+    memo.put(b'c', [])
+    memo.flush()
+    assert [memo.get(key) is MISSING for key in (b'a', b'b', b'c')] == [False, True, False]
+
+
+def test_engine_replays_pages_it_has_seen(path):
+    async def run(memo):
+        async with Engine(origin=server.origin, memo=memo) as engine:
+            return await engine.scrape(['meesho'])
+
+    with StandInServer(site_pages(PLATFORMS.values())) as server:
+        memo = MemoStore(path)
+        asyncio.run(run(memo))
+        assert memo.stats.page_hits == 0
+        asyncio.run(run(memo))
+    assert memo.stats.page_hits == len(PLATFORMS['meesho'].urls)
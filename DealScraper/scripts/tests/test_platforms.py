@@ -0,0 +1,98 @@
+import pytest
+
+from dealscraper.platforms import PLATFORMS, Drop, get_platform
+from dealscraper.selectors import parse_html
+from pages import build_page
+
+AMAZON_CARD = (
+    '<div class="DealCard"><a href="/dp/B00001?ref=deal"><img src="https://m.media-amazon.com/images/I/1.jpg"></a>'
+    '<div class="DealTitle">Wireless Headphones Pro</div>'
+    '<span class="a-price">₹1,499</span><span class="savingsPercentage">25% off</span></div>'
+)
+
+
+def cards(name, html):
+    return get_platform(name).find_cards(parse_html(f'<html><body>{html}</body></html>'.encode()))
+
+
+def check(name, html):
+    [card] = cards(name, html)
+    return get_platform(name).check_card(card)
+
+
+def test_amazon_card():
+    deal, reason = check('amazon', AMAZON_CARD)
+    assert reason is None
+    assert deal.as_dict() == {
+        'title': 'Wireless Headphones Pro', 'platform': 'amazon', 'category': 'electronics',
+        'originalPrice': 199800, 'discountedPrice': 149900, 'discountPercentage': 25,
+        'imageUrl': 'https://m.media-amazon.com/images/I/1.jpg',
+        'dealUrl': 'https://www.amazon.in/dp/B00001?ref=deal', 'expiresAt': None,
+    }
+
+
+def test_flipkart_card_prefers_the_listed_original_price():
+    deal, reason = check('flipkart', (
+        '<div class="_1AtVbE"><a href="/p/item1?pid=ITM1"><img src="https://rukminim1.flixcart.com/image/1.jpg">'
+        '<div class="_4rR01T">Cotton Running Shoe</div></a>'
+        '<div class="_30jeq3">₹999</div><div class="_3Djpdu">₹1,999</div>'
+        '<div class="_3Ay6sb"><span>50% off</span></div></div>'
+    ))
+    assert reason is None
+    assert (deal.discounted_price, deal.original_price, deal.discount_percentage) == (99900, 199900, 50)
+    assert deal.deal_url == 'https://www.flipkart.com/p/item1?pid=ITM1'
+
+
+def test_meesho_card_takes_its_link_and_lazy_image_from_the_wrapper():
+    deal, reason = check('meesho', (
+        '<a href="/product-1/p/1"><div class="ProductCard__Wrapper">'
+        '<img data-src="https://images.meesho.com/images/1.jpg">'
+        '<p class="ProductCard__ProductTitle">Printed Cotton Kurta</p><h5>₹349</h5></div></a>'
+    ))
+    assert reason is None
+    assert deal.deal_url == 'https://www.meesho.com/product-1/p/1'
+    assert deal.image_url == 'https://images.meesho.com/images/1.jpg'
+    assert (deal.discounted_price, deal.discount_percentage, deal.category) == (34900, 50, 'fashion')
+
+
+@pytest.mark.parametrize('html, reason', [
+    (AMAZON_CARD.replace('<span class="a-price">₹1,499</span>', ''), 'no price'),
+    (AMAZON_CARD.replace('₹1,499', 'Sold out'), 'unparseable price'),
+    (AMAZON_CARD.replace('Wireless Headphones Pro', 'Mat'), 'title too short'),
+    (AMAZON_CARD.replace('href="/dp/B00001?ref=deal"', 'href="javascript:void(0)"'), 'no link'),
+    (AMAZON_CARD.replace('href="/dp/B00001?ref=deal"', 'href="#"'), 'no link'),
+])
+def test_cards_are_dropped_with_a_reason(html, reason):
+    assert check('amazon', html) == (None, reason)
+
+
+def test_missing_discount_falls_back_to_the_platform_default():
+    deal, _ = check('amazon', AMAZON_CARD.replace('<span class="savingsPercentage">25% off</span>', ''))
+    assert deal.discount_percentage == 30
+
+
+@pytest.mark.parametrize('name, html, url', [
+    ('amazon', '<div class="DealCard"><a href="/dp/1">x</a></div>', 'https://www.amazon.in/dp/1'),
+    ('amazon', '<a href="/dp/2"><span><div class="DealCard">x</div></span></a>', 'https://www.amazon.in/dp/2'),
+    ('flipkart', '<a class="_1AtVbE" href="/p/item3">x</a>', 'https://www.flipkart.com/p/item3'),
+])
+def test_deal_url(name, html, url):
+    [card] = cards(name, html)
+    assert get_platform(name).deal_url(card) == url
+
+
+def test_deal_url_without_a_link_drops_the_card():
+    [card] = cards('amazon', '<div class="DealCard">x</div>')
+    with pytest.raises(Drop, match='no link'):
+        get_platform('amazon').deal_url(card)
+
+
+@pytest.mark.parametrize('name', list(PLATFORMS))
+def test_stand_in_pages(name):
+    platform = get_platform(name)
+    deals = platform.extract(build_page(name, platform.urls[0]))
+    (select,) = platform.selectors['cards']
+    assert 0 < len(deals) <= select.limit
+    for deal in deals:
+        assert deal.platform == name and deal.deal_url.startswith(platform.base_url + '/')
+        assert deal.original_price >= deal.discounted_price > 0
@@ -0,0 +1,117 @@
+import asyncio
+import io
+import json
+import queue
+
+import pytest
+
+from dealscraper.delta import DeltaIndex
+from dealscraper.engine import Engine
+from dealscraper.platforms import PLATFORMS
+from dealscraper.scheduler import ResultStore, Scheduler
+from dealscraper.util import make_deal
+from pages import site_pages
+from server import StandInServer
+
+# Serve one Myntra page so every run picks the same deals for the quota.
+STATUSES = {'/www.myntra.com/shop/women': 404}
+
+
+class Input:
+    """A stdin whose lines are written by the test while the scheduler runs."""
+
+    def __init__(self):
+        self.lines = queue.Queue()
+
+    def readline(self):
+        return self.lines.get()
+
+
+@pytest.fixture(scope='module')
+def pages():
+    return site_pages(PLATFORMS.values())
+
+
+def records(stdout):
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+async def ends(stdout, count):
+    while sum(record.get('type') == 'end' for record in records(stdout)) < count:
+        await asyncio.sleep(0.01)
+
+
+def run(origin, script, **options):
+    """Run a scheduler for ``script(stdin, stdout)`` and return everything it wrote."""
+    stdin, stdout = Input(), io.StringIO()
+
+    async def main():
+        async with Engine(origin=origin) as engine:
+            scheduler = Scheduler(engine, intervals={name: 3600 for name in PLATFORMS}, jitter=0,
+                                  stdin=stdin, stdout=stdout, **options)
+            task = asyncio.ensure_future(scheduler.run())
+            try:
+                await asyncio.wait_for(script(stdin, stdout), 10)
+            finally:
+                stdin.lines.put('')
+                await task
+
+    asyncio.run(main())
+    return records(stdout)
+
+
+def test_snapshot_runs_and_refresh(pages, tmp_path):
+    results = ResultStore(str(tmp_path / 'results.sqlite3'))
+    old = make_deal('myntra', 'Old Cotton Shirt', 'fashion', 1000, 500, 50,
+                    'https://assets.myntassets.com/old.jpg', 'https://www.myntra.com/old')
+    results.put('myntra', [old], scraped_at=123.0)
+    delta = DeltaIndex(str(tmp_path / 'delta.sqlite3'))
+
+    async def script(stdin, stdout):
+        await ends(stdout, 1)
+        stdin.lines.put(json.dumps({'type': 'refresh', 'platforms': ['myntra']}) + '\n')
+        await ends(stdout, 2)
+
+    with StandInServer(pages, statuses=STATUSES) as server:
+        output = run(server.origin, script, names=['myntra'], results=results, delta=delta, batch_size=4)
+
+    snapshot, *rest = output
+    assert snapshot == {'platform': 'myntra', 'type': 'snapshot', 'deals': [old.as_dict()], 'scrapedAt': 123.0}
+    split = next(i for i, record in enumerate(rest) if record['type'] == 'end') + 1
+    first, second = rest[:split], rest[split:]
+    quota = PLATFORMS['myntra'].max_deals
+
+    assert first[0] == {'platform': 'myntra', 'type': 'start'}
+    assert [len(record['deals']) for record in first[1:-1]] == [4, 4, 2]
+    end = first[-1]
+    assert end['ok'] and end['count'] == quota and end['delta']['new'] == quota
+    assert sorted(page['status'] for page in end['metrics']['pages']) == [200, 404]
+
+    # Nothing changed, so the refresh sends no deals but still succeeds.
+    assert [record['type'] for record in second] == ['start', 'end']
+    assert second[-1]['ok'] and second[-1]['count'] == 0
+    deals, _ = results.get('myntra')
+    assert len(deals) == quota and old.title not in {deal.title for deal in deals}
+
+
+def test_failed_run_keeps_the_previous_result(tmp_path):
+    results = ResultStore(str(tmp_path / 'results.sqlite3'))
+    old = make_deal('meesho', 'Old Printed Kurta', 'fashion', 1000, 500, 50,
+                    'https://images.meesho.com/old.jpg', 'https://www.meesho.com/old')
+    results.put('meesho', [old], scraped_at=123.0)
+
+    async def script(stdin, stdout):
+        stdin.lines.put('{"type": "reload"}\n')
+        await ends(stdout, 1)
+
+    with StandInServer() as server:
+        origin = server.origin
+    output = run(origin, script, names=['meesho'], results=results)
+
+    [error] = [record for record in output if record['type'] == 'error']
+    assert error['error'].startswith('Bad command')
+    [end] = [record for record in output if record['type'] == 'end']
+    assert not end['ok'] and end['count'] == 0
+    assert len(end['errors']) == len(PLATFORMS['meesho'].urls)
+    deals, scraped_at = results.get('meesho')
+    assert [deal.title for deal in deals] == [old.title] and scraped_at == 123.0
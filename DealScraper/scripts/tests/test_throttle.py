@@ -0,0 +1,121 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from dealscraper.throttle import CircuitBreaker, CircuitOpen, Throttle, TokenBucket, backoff_delay, parse_retry_after
+
+
+def test_backoff_delay_grows_and_is_capped():
+    for attempt in range(10):
+        delay = backoff_delay(attempt, base=0.5, cap=4)
+        assert 0 <= delay <= min(4, 0.5 * 2 ** attempt)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    assert 25 <= parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0
+
+
+def test_bucket_rate_halves_when_throttled_and_recovers():
+    bucket = TokenBucket(rate=10, burst=1)
+    for _ in range(10):
+        bucket.throttled()
+    assert bucket.rate == 1
+    for _ in range(30):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+
+def test_bucket_allows_burst_then_paces():
+    async def take(bucket, n):
+        start = time.monotonic()
+        for _ in range(n):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    bucket = TokenBucket(rate=20, burst=3)
+    assert asyncio.run(take(bucket, 3)) < 0.02
+    assert asyncio.run(take(bucket, 2)) >= 0.09
+
+
+def test_breaker_opens_after_threshold_and_recovers_through_one_trial():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(2):
+        breaker.failure()
+    breaker.allow('host')
+    breaker.failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpen):
+        breaker.allow('host')
+
+    breaker.opened_at -= 61
+    assert breaker.state == 'half-open'
+    breaker.allow('host')
+    with pytest.raises(CircuitOpen):
+        breaker.allow('host')
+    breaker.success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+
+
+def test_breaker_reopens_when_trial_fails():
+    breaker = CircuitBreaker(threshold=3, cooldown=60, failures=3, opened_at=time.time() - 61)
+    breaker.allow('host')
+    breaker.failure()
+    assert breaker.state == 'open'
+
+
+def test_breaker_state_persists(tmp_path):
+    path = str(tmp_path / 'throttle.sqlite3')
+    throttle = Throttle(path, threshold=2, cooldown=60, retries=5)
+    assert throttle.failed('a.example', 0) is not None
+    assert throttle.failed('a.example', 1) is None
+    throttle.close()
+
+    throttle = Throttle(path, threshold=2, cooldown=60)
+    with pytest.raises(CircuitOpen):
+        asyncio.run(throttle.acquire('a.example'))
+    asyncio.run(throttle.acquire('b.example'))
+    throttle.close()
+
+
+def test_failed_gives_up_after_retries_and_honours_retry_after(tmp_path):
+    throttle = Throttle(str(tmp_path / 'throttle.sqlite3'), retries=2, threshold=10)
+    assert throttle.failed('host', 0, throttled=True, retry_after='3') >= 3
+    assert throttle.bucket('host').paused_until > time.monotonic() + 2
+    assert throttle.bucket('host').rate == throttle.rate / 2
+    assert throttle.failed('host', 1) is not None
+    assert throttle.failed('host', 2) is None
+    throttle.succeeded('host')
+    assert throttle.breaker('host').failures == 0
+    throttle.close()
+
+
+def test_rejected_responses_trip_the_breaker(tmp_path):
+    throttle = Throttle(str(tmp_path / 'throttle.sqlite3'), threshold=2)
+    throttle.rejected('host')
+    throttle.rejected('host')
+    assert throttle.breaker('host').state == 'open'
+    throttle.close()
+
+
+def test_cancelled_trial_is_released(tmp_path):
+    throttle = Throttle(str(tmp_path / 'throttle.sqlite3'), rate=0.001, burst=1, threshold=1, cooldown=60)
+    breaker = throttle.breaker('host')
+    breaker.failure()
+    breaker.opened_at -= 61
+    throttle.bucket('host').tokens = 0
+
+    async def cancel_trial():
+        task = asyncio.ensure_future(throttle.acquire('host'))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancel_trial())
+    assert breaker.state == 'half-open' and not breaker.trial
+    throttle.close()
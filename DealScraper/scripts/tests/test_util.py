@@ -0,0 +1,15 @@
+from dealscraper.util import absolute_url
+
+BASE = 'https://www.meesho.com'
+
+
+def test_absolute_url_resolves_product_links():
+    assert absolute_url('/p/1', BASE) == 'https://www.meesho.com/p/1'
+    assert absolute_url('p/1', BASE) == 'https://www.meesho.com/p/1'
+    assert absolute_url('//cdn.example.com/p/2', BASE) == 'https://cdn.example.com/p/2'
+    assert absolute_url('https://other.example.com/p/3?x=1', BASE) == 'https://other.example.com/p/3?x=1'
+
+
+def test_absolute_url_rejects_links_that_are_not_a_product():
+    for href in (None, '', '#', '/', BASE, BASE + '/', 'javascript:void(0)', 'mailto:a@example.com'):
+        assert absolute_url(href, BASE) is None
@@ -0,0 +1,99 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from dealscraper.delta import DeltaIndex
+from dealscraper.engine import Engine
+from dealscraper.platforms import PLATFORMS
+from dealscraper.worker import Worker
+from pages import site_pages
+from server import StandInServer
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StandInServer(site_pages(PLATFORMS.values())) as server:
+        yield server
+
+
+def serve(server, *batches, delta=None):
+    """Feed each batch of request lines to a worker in turn; return the records of each."""
+    async def run():
+        answers = []
+        async with Engine(origin=server.origin) as engine:
+            for lines in batches:
+                stdout = io.StringIO()
+                stdin = io.StringIO(''.join(line + '\n' for line in lines))
+                await Worker(engine, stdin, stdout, delta=delta).run()
+                answers.append([json.loads(line) for line in stdout.getvalue().splitlines()])
+        return answers
+    return asyncio.run(run())
+
+
+def by_id(records):
+    answers = {}
+    for record in records:
+        answers.setdefault(record['id'], []).append(record)
+    return answers
+
+
+def test_requests_are_answered_by_id(server):
+    [records] = serve(server, [
+        json.dumps({'id': 1, 'platforms': ['amazon']}),
+        json.dumps({'id': 2, 'platforms': ['myntra'], 'stream': True}),
+        json.dumps({'id': 3, 'platforms': ['nowhere']}),
+        'not json',
+        '[1]',
+    ])
+    answers = by_id(records)
+
+    [buffered] = answers[1]
+    assert len(buffered['deals']) == PLATFORMS['amazon'].max_deals
+    assert {deal['platform'] for deal in buffered['deals']} == {'amazon'}
+
+    *deals, end = answers[2]
+    assert {record['type'] for record in deals} == {'deal'}
+    assert end == {'id': 2, 'type': 'end', 'count': len(deals)}
+    assert set(deals[0]['deal']) >= {'title', 'dealUrl', 'discountedPrice'}
+
+    assert answers[3] == [{'id': 3, 'type': 'error', 'error': 'Unknown platform: nowhere'}]
+    assert [record['error'].split(':')[0] for record in answers[None]] == ['Bad request'] * 2
+
+
+def test_streams_batches_and_metrics(server):
+    [records] = serve(server, [
+        json.dumps({'id': 'b', 'platforms': ['flipkart'], 'stream': True, 'batch': 4, 'metrics': True}),
+        json.dumps({'id': 'c', 'platforms': ['flipkart'], 'stream': True, 'batch': 4, 'columnar': True}),
+    ])
+    answers = by_id(records)
+    *batches, end = answers['b']
+    quota = PLATFORMS['flipkart'].max_deals
+    assert [len(batch['deals']) for batch in batches] == [4] * (quota // 4) + ([quota % 4] if quota % 4 else [])
+    assert end['count'] == quota
+    assert {page['url'] for page in end['metrics']['pages']} == set(PLATFORMS['flipkart'].urls)
+
+    *columns, end = answers['c']
+    assert all(record['type'] == 'columns' for record in columns)
+    assert end['count'] == quota
+
+
+def test_delta_requests_only_get_changes(tmp_path):
+    delta = DeltaIndex(str(tmp_path / 'delta.sqlite3'))
+    request = {'id': 1, 'platforms': ['meesho'], 'stream': True, 'delta': True}
+    # Serve a single page so every run picks the same deals for the quota.
+    pages = site_pages(PLATFORMS.values())
+    with StandInServer(pages, statuses={'/www.meesho.com/top-deals/pl/3oo': 404}) as server:
+        first, second, reseed = serve(
+            server,
+            [json.dumps(request)],
+            [json.dumps(request)],
+            [json.dumps({**request, 'delta': False})],
+            delta=delta,
+        )
+    quota = PLATFORMS['meesho'].max_deals
+    assert first[-1]['count'] == quota and first[-1]['delta']['new'] == quota
+    assert second == [{'id': 1, 'type': 'end', 'count': 0,
+                       'delta': {'new': 0, 'changed': 0, 'stale': 0, 'unchanged': quota}}]
+    assert reseed[-1]['count'] == quota
@@ -1,6 +1,7 @@
 import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { setupVite, serveStatic, log } from "./vite";
+import { scrapingService } from "./services/scraper";
 
 const app = express();
 
@@ -77,5 +78,11 @@ app.use((req, res, next) => {
     reusePort: true,
   }, () => {
     log(`serving on port ${port}`);
+    // Scrape in the background so the API only serves stored deals. Set
+    // SCRAPER_SCHEDULE=off where no long-running process is allowed; a
+    // refresh request then starts the scheduler on demand.
+    if (process.env.SCRAPER_SCHEDULE !== "off") {
+      scrapingService.start();
+    }
   });
 })();
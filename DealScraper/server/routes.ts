@@ -32,6 +32,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Get the background scraper's per-platform schedule
+  app.get("/api/deals/status", (req, res) => {
+    res.json({ platforms: scrapingService.status() });
+  });
+
   // Get single deal by ID
   app.get("/api/deals/:id", async (req, res) => {
     try {
@@ -48,14 +53,13 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  // Refresh deals - trigger scraping
-  app.post("/api/deals/refresh", async (req, res) => {
+  // Refresh deals - ask the background scraper for an immediate run
+  app.post("/api/deals/refresh", (req, res) => {
     try {
-      await scrapingService.scrapeAllPlatforms();
-      const stats = await storage.getDealStats();
-      res.json({ 
-        message: "Deals refreshed successfully", 
-        stats,
+      const platforms = scrapingService.refresh();
+      res.status(202).json({
+        message: "Refresh started; new deals are stored as they are scraped",
+        platforms,
         timestamp: new Date().toISOString()
       });
     } catch (error) {
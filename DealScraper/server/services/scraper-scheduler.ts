@@ -0,0 +1,241 @@
+import { type InsertDeal } from "@shared/schema";
+import { spawn, type ChildProcessWithoutNullStreams } from "child_process";
+import { createInterface } from "readline";
+import path from "path";
+
+const BATCH_SIZE = 25;
+const RESTART_DELAY_MS = 5_000;
+
+export interface PageMetrics {
+  platform: string;
+  url: string;
+  source: "network" | "cache" | "revalidated";
+  status: number | null;
+  retries: number;
+  memo: boolean;
+  dnsMs: number | null;
+  connectMs: number | null;
+  ttfbMs: number | null;
+  totalMs: number | null;
+  bytes: number;
+  parseMs: number;
+  extractMs: number;
+  cardsSeen: number;
+  deals: number;
+  emitted: number;
+  dropped: Record<string, number>;
+  error: string | null;
+}
+
+export interface DeltaStats {
+  new: number;
+  changed: number;
+  stale: number;
+  unchanged: number;
+}
+
+// Trailer of one scheduled run of a platform. ok is false when the run found
+// no deals, in which case the previously stored deals stay current.
+export interface RunResult {
+  count: number;
+  ok: boolean;
+  nextRunAt: number;
+  errors?: string[];
+  metrics?: { pages: PageMetrics[] };
+  delta?: DeltaStats;
+}
+
+export interface PlatformStatus {
+  platform: string;
+  running: boolean;
+  lastRunAt: string | null;
+  lastOk: boolean | null;
+  lastCount: number | null;
+  lastErrors: string[];
+  nextRunAt: string | null;
+}
+
+export interface SchedulerHandlers {
+  onDeals: (platform: string, deals: InsertDeal[]) => void;
+  onRun: (platform: string, result: RunResult) => void;
+}
+
+// A batch of deals packed one array per field; platform and category hold
+// indexes into their entry in dictionaries.
+interface ColumnsRecord {
+  count: number;
+  columns: Record<string, unknown[]>;
+  dictionaries: Record<string, string[]>;
+}
+
+type SchedulerRecord =
+  | { platform: string; type: "snapshot"; deals: InsertDeal[]; scrapedAt: number }
+  | { platform: string; type: "start" }
+  | { platform: string; type: "deal"; deal: InsertDeal }
+  | { platform: string; type: "batch"; deals: InsertDeal[] }
+  | ({ platform: string; type: "columns" } & ColumnsRecord)
+  | ({ platform: string; type: "end" } & RunResult)
+  | { type: "error"; error: string };
+
+const toIso = (seconds: number) => new Date(seconds * 1000).toISOString();
+
+export function decodeColumns({ count, columns, dictionaries }: ColumnsRecord): InsertDeal[] {
+  const fields = Object.keys(columns);
+  const deals = new Array<InsertDeal>(count);
+  for (let i = 0; i < count; i++) {
+    const deal: Record<string, unknown> = {};
+    for (const field of fields) {
+      const value = columns[field][i];
+      deal[field] = field in dictionaries ? dictionaries[field][value as number] : value;
+    }
+    deals[i] = deal as InsertDeal;
+  }
+  return deals;
+}
+
+// Keeps one `scrape.py --schedule` process running. It re-scrapes every
+// platform on its own interval and streams the deals back as line-delimited
+// JSON, in columnar batches that are cheaper to encode and parse than one
+// object per deal, so API requests only ever read stored deals. On startup
+// the process replays each platform's last good result as a snapshot, which
+// repopulates a fresh store even though its change index skips unchanged
+// deals. The process is restarted after RESTART_DELAY_MS if it exits.
+export class ScraperScheduler {
+  private process: ChildProcessWithoutNullStreams | null = null;
+  private handlers: SchedulerHandlers | null = null;
+  private restartTimer: NodeJS.Timeout | null = null;
+  private statuses = new Map<string, PlatformStatus>();
+
+  start(handlers: SchedulerHandlers): void {
+    this.handlers = handlers;
+    this.ensureProcess();
+  }
+
+  // Asks for an immediate run of the given platforms (all when omitted)
+  // without waiting for it; the deals arrive through onDeals as usual.
+  refresh(platforms?: string[]): void {
+    this.ensureProcess().stdin.write(JSON.stringify({ type: "refresh", platforms }) + "\n");
+  }
+
+  status(): PlatformStatus[] {
+    return Array.from(this.statuses.values());
+  }
+
+  stop(): void {
+    this.handlers = null;
+    if (this.restartTimer) {
+      clearTimeout(this.restartTimer);
+      this.restartTimer = null;
+    }
+    this.process?.stdin.end();
+    this.process = null;
+  }
+
+  private ensureProcess(): ChildProcessWithoutNullStreams {
+    if (this.process) {
+      return this.process;
+    }
+
+    const scriptPath = path.join(process.cwd(), 'scripts', 'scrape.py');
+    const scheduler = spawn('python3', [
+      scriptPath, '--schedule', '--throttle', '--incremental', '--cache', '--memo', '--delta', '--history', '--columnar',
+      '--batch-size', String(BATCH_SIZE),
+    ]);
+    this.process = scheduler;
+
+    createInterface({ input: scheduler.stdout }).on('line', (line) => this.handleLine(line));
+    createInterface({ input: scheduler.stderr }).on('line', (line) => {
+      console.error('scraper scheduler:', line);
+    });
+
+    const restart = (reason: string) => {
+      if (this.process !== scheduler) {
+        return;
+      }
+      this.process = null;
+      this.statuses.forEach((status) => {
+        status.running = false;
+      });
+      if (this.handlers && !this.restartTimer) {
+        console.error(`scraper scheduler ${reason}, restarting in ${RESTART_DELAY_MS}ms`);
+        this.restartTimer = setTimeout(() => {
+          this.restartTimer = null;
+          if (this.handlers) {
+            this.ensureProcess();
+          }
+        }, RESTART_DELAY_MS);
+      }
+    };
+
+    scheduler.on('error', (error) => restart(`failed: ${error.message}`));
+    // Writing a refresh command to a process that has died, or failed to
+    // spawn, fails with EPIPE or ERR_STREAM_DESTROYED; unhandled, that
+    // would take the whole server down.
+    scheduler.stdin.on('error', (error) => {
+      scheduler.kill();
+      restart(`stdin failed: ${error.message}`);
+    });
+    scheduler.on('exit', (code, signal) => restart(`exited (code ${code}, signal ${signal})`));
+
+    return scheduler;
+  }
+
+  private handleLine(line: string): void {
+    let record: SchedulerRecord;
+    try {
+      record = JSON.parse(line);
+    } catch {
+      console.error('scraper scheduler: unparseable output:', line);
+      return;
+    }
+
+    if (record.type === "error") {
+      console.error('scraper scheduler:', record.error);
+      return;
+    }
+
+    const status = this.statusOf(record.platform);
+    switch (record.type) {
+      case "snapshot":
+        status.lastRunAt ??= toIso(record.scrapedAt);
+        this.handlers?.onDeals(record.platform, record.deals);
+        return;
+      case "start":
+        status.running = true;
+        return;
+      case "deal":
+        this.handlers?.onDeals(record.platform, [record.deal]);
+        return;
+      case "batch":
+        this.handlers?.onDeals(record.platform, record.deals);
+        return;
+      case "columns":
+        this.handlers?.onDeals(record.platform, decodeColumns(record));
+        return;
+      case "end": {
+        const { platform, type, ...result } = record;
+        Object.assign(status, {
+          running: false,
+          lastRunAt: new Date().toISOString(),
+          lastOk: result.ok,
+          lastCount: result.count,
+          lastErrors: result.errors ?? [],
+          nextRunAt: toIso(result.nextRunAt),
+        });
+        this.handlers?.onRun(platform, result);
+        return;
+      }
+    }
+  }
+
+  private statusOf(platform: string): PlatformStatus {
+    let status = this.statuses.get(platform);
+    if (!status) {
+      status = { platform, running: false, lastRunAt: null, lastOk: null, lastCount: null, lastErrors: [], nextRunAt: null };
+      this.statuses.set(platform, status);
+    }
+    return status;
+  }
+}
+
+export const scraperScheduler = new ScraperScheduler();
@@ -1,101 +1,84 @@
 import { type InsertDeal } from "@shared/schema";
 import { storage } from "../storage";
-import { spawn } from "child_process";
-import path from "path";
+import { scraperScheduler, type PageMetrics, type PlatformStatus, type RunResult } from "./scraper-scheduler";
 
+// Stores the deals the background scheduler publishes. Refreshing only asks
+// the scheduler for an early run, so API requests never wait on a scrape.
 export class ScrapingService {
-  private isRunning = false;
-  
-  async scrapeAllPlatforms(): Promise<void> {
-    if (this.isRunning) {
-      throw new Error("Scraping is already in progress");
+  private inserts: Promise<unknown> = Promise.resolve();
+  private started = false;
+
+  start(): void {
+    this.started = true;
+    scraperScheduler.start({
+      onDeals: (platform, deals) => this.store(platform, deals),
+      onRun: (platform, result) => this.finishRun(platform, result),
+    });
+  }
+
+  refresh(platforms?: string[]): PlatformStatus[] {
+    if (this.started) {
+      scraperScheduler.refresh(platforms);
+    } else {
+      // A newly started scheduler runs every platform right away.
+      this.start();
+    }
+    return scraperScheduler.status();
+  }
+
+  status(): PlatformStatus[] {
+    return scraperScheduler.status();
+  }
+
+  private store(platform: string, deals: InsertDeal[]): void {
+    const wanted = deals.filter((deal) => deal.discountPercentage >= 20);
+    if (wanted.length === 0) {
+      return;
     }
-    
-    this.isRunning = true;
+    // Chained so batches are written in the order they were scraped.
+    this.inserts = this.inserts
+      .then(() => storage.createDeals(wanted))
+      .catch((error) => console.error(`${platform} insert error:`, error));
+  }
+
+  private async finishRun(platform: string, result: RunResult): Promise<void> {
+    await this.inserts;
+    if (result.ok) {
+      console.log(`${platform}: scraped, ${result.count} new or changed deals`);
+    } else {
+      console.error(`${platform}: no deals found, keeping the previous ones`, result.errors ?? []);
+    }
+    this.logStats(result);
+
     try {
-      console.log('Starting deal scraping...');
-      
       const cleared = await storage.clearExpiredDeals();
-      console.log(`Cleared ${cleared} expired deals`);
-      
-      const results = await Promise.allSettled([
-        this.scrapePlatform('amazon'),
-        this.scrapePlatform('flipkart'),
-        this.scrapePlatform('myntra'),
-        this.scrapePlatform('meesho'),
-      ]);
-      
-      let totalScraped = 0;
-      const platforms = ['Amazon', 'Flipkart', 'Myntra', 'Meesho'];
-      
-      results.forEach((result, index) => {
-        if (result.status === 'fulfilled') {
-          totalScraped += result.value;
-          console.log(`${platforms[index]}: Scraped ${result.value} deals`);
-        } else {
-          console.error(`${platforms[index]}: Failed -`, result.reason?.message || result.reason);
-        }
-      });
-      
-      console.log(`Total scraped: ${totalScraped} deals`);
-      
-      if (totalScraped === 0) {
-        throw new Error('Failed to scrape any deals from any platform');
+      if (cleared > 0) {
+        console.log(`Cleared ${cleared} expired deals`);
       }
-    } finally {
-      this.isRunning = false;
+    } catch (error) {
+      console.error('Failed to clear expired deals:', error);
     }
   }
-  
-  private async scrapePlatform(platform: string): Promise<number> {
-    return new Promise((resolve, reject) => {
-      const scriptPath = path.join(process.cwd(), 'scripts', `scrape_${platform}.py`);
-      
-      const pythonProcess = spawn('python3', [scriptPath]);
-      
-      let stdout = '';
-      let stderr = '';
-      
-      pythonProcess.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-      
-      pythonProcess.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-      
-      pythonProcess.on('close', async (code) => {
-        if (code !== 0) {
-          console.error(`${platform} scraper error:`, stderr);
-          resolve(0);
-          return;
-        }
-        
-        try {
-          const deals: InsertDeal[] = JSON.parse(stdout);
-          
-          let count = 0;
-          for (const deal of deals) {
-            if (deal.discountPercentage >= 20) {
-              await storage.createDeal(deal);
-              count++;
-            }
-          }
-          
-          resolve(count);
-        } catch (error) {
-          console.error(`${platform} parse error:`, error);
-          console.error('stdout:', stdout);
-          resolve(0);
-        }
-      });
-      
-      pythonProcess.on('error', (error) => {
-        console.error(`${platform} spawn error:`, error);
-        resolve(0);
-      });
-    });
+
+  private logStats({ metrics, delta }: RunResult): void {
+    for (const page of metrics?.pages ?? []) {
+      console.log(formatPageMetrics(page));
+    }
+    if (delta) {
+      console.log(`scraper delta: ${delta.new} new, ${delta.changed} changed, ${delta.stale} refreshed, ${delta.unchanged} unchanged skipped`);
+    }
   }
 }
 
+function formatPageMetrics(page: PageMetrics): string {
+  const ms = (value: number | null) => value === null ? '-' : `${value}ms`;
+  const dropped = Object.entries(page.dropped).map(([reason, n]) => `${reason} ${n}`).join(', ');
+  return `${page.platform} ${page.url} [${page.source} ${page.status ?? '-'}${page.retries ? ` ${page.retries} retries` : ''}${page.memo ? ' memo' : ''}] ` +
+    `connect ${ms(page.connectMs)} ttfb ${ms(page.ttfbMs)} total ${ms(page.totalMs)} ${Math.round(page.bytes / 1024)}KB, ` +
+    `parse ${ms(page.parseMs)} extract ${ms(page.extractMs)}, ` +
+    `${page.cardsSeen} cards -> ${page.deals} deals, ${page.emitted} emitted` +
+    (dropped ? ` (dropped: ${dropped})` : '') +
+    (page.error ? ` error: ${page.error}` : '');
+}
+
 export const scrapingService = new ScrapingService();
@@ -4,6 +4,9 @@ import { randomUUID } from "crypto";
 
 export interface IStorage {
   createDeal(deal: InsertDeal): Promise<Deal>;
+  // Inserts a batch of deals in one round-trip; deals whose dealUrl already
+  // exists replace the stored row.
+  createDeals(deals: InsertDeal[]): Promise<Deal[]>;
   getDeals(filters?: DealFilters): Promise<{ deals: Deal[]; total: number }>;
   getDealById(id: string): Promise<Deal | undefined>;
   updateDeal(id: string, deal: Partial<InsertDeal>): Promise<Deal | undefined>;
@@ -17,6 +20,14 @@ export interface IStorage {
   }>;
 }
 
+// Keeps the last deal for each dealUrl, since one INSERT ... ON CONFLICT
+// cannot touch the same row twice.
+function uniqueByDealUrl(batch: InsertDeal[]): InsertDeal[] {
+  return Array.from(new Map(batch.map((deal) => [deal.dealUrl, deal] as const)).values());
+}
+
+const excluded = (column: string) => sql.raw(`excluded.${column}`);
+
 class PostgresStorage implements IStorage {
   private db: any;
   private dbPromise: Promise<any>;
@@ -41,6 +52,32 @@ class PostgresStorage implements IStorage {
     return deal;
   }
 
+  async createDeals(insertDeals: InsertDeal[]): Promise<Deal[]> {
+    const batch = uniqueByDealUrl(insertDeals);
+    if (batch.length === 0) {
+      return [];
+    }
+    const db = await this.ensureDb();
+    return db
+      .insert(deals)
+      .values(batch)
+      .onConflictDoUpdate({
+        target: deals.dealUrl,
+        set: {
+          title: excluded("title"),
+          platform: excluded("platform"),
+          category: excluded("category"),
+          originalPrice: excluded("original_price"),
+          discountedPrice: excluded("discounted_price"),
+          discountPercentage: excluded("discount_percentage"),
+          imageUrl: excluded("image_url"),
+          expiresAt: excluded("expires_at"),
+          scrapedAt: sql`now()`,
+        },
+      })
+      .returning();
+  }
+
   async getDeals(filters?: DealFilters): Promise<{ deals: Deal[]; total: number }> {
     const db = await this.ensureDb();
     const now = new Date();
@@ -178,19 +215,31 @@ class MemStorage implements IStorage {
     this.deals = new Map();
   }
 
-  async createDeal(insertDeal: InsertDeal): Promise<Deal> {
-    const id = randomUUID();
-    const deal: Deal = { 
+  private toDeal(insertDeal: InsertDeal, id: string): Deal {
+    return { 
       ...insertDeal,
       imageUrl: insertDeal.imageUrl ?? null,
       expiresAt: insertDeal.expiresAt ? (insertDeal.expiresAt instanceof Date ? insertDeal.expiresAt : new Date(insertDeal.expiresAt)) : null,
       id, 
       scrapedAt: new Date()
     };
-    this.deals.set(id, deal);
+  }
+
+  async createDeal(insertDeal: InsertDeal): Promise<Deal> {
+    const deal = this.toDeal(insertDeal, randomUUID());
+    this.deals.set(deal.id, deal);
     return deal;
   }
 
+  async createDeals(insertDeals: InsertDeal[]): Promise<Deal[]> {
+    const idsByUrl = new Map(Array.from(this.deals.values(), (deal) => [deal.dealUrl, deal.id] as const));
+    return uniqueByDealUrl(insertDeals).map((insertDeal) => {
+      const deal = this.toDeal(insertDeal, idsByUrl.get(insertDeal.dealUrl) ?? randomUUID());
+      this.deals.set(deal.id, deal);
+      return deal;
+    });
+  }
+
   async getDeals(filters?: DealFilters): Promise<{ deals: Deal[]; total: number }> {
     let deals = Array.from(this.deals.values());
     
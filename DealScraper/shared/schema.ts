@@ -1,5 +1,5 @@
 import { sql } from "drizzle-orm";
-import { pgTable, text, varchar, integer, timestamp } from "drizzle-orm/pg-core";
+import { pgTable, text, varchar, integer, timestamp, uniqueIndex } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
@@ -15,7 +15,9 @@ export const deals = pgTable("deals", {
   dealUrl: text("deal_url").notNull(),
   expiresAt: timestamp("expires_at"),
   scrapedAt: timestamp("scraped_at").defaultNow(),
-});
+}, (table) => [
+  uniqueIndex("deals_deal_url_idx").on(table.dealUrl),
+]);
 
 export const insertDealSchema = createInsertSchema(deals).omit({
   id: true,